@@ -22,10 +22,14 @@ setup(
     install_requires=[
         "requests>=2.25.1",
         "beautifulsoup4>=4.9.3",
+        "lxml>=4.9",
         "fastapi>=0.115.0",
         "uvicorn>=0.30.0",
         "httpx>=0.27.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.8", "selectolax>=0.3.21", "brotli>=1.0"],
+    },
     entry_points={
         "console_scripts": [
             "web-analyzer=src.main:main",
@@ -0,0 +1,5 @@
+"""Allow ``python -m src`` to run the CLI."""
+
+from .main import main
+
+raise SystemExit(main())
@@ -2,17 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import html as html_lib
 import json
+import os
+import re
+import sys
 import time
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, TextIO, Tuple
+from urllib.parse import ParseResult, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from .cache import AuditStore, TTLCache, content_digest
+
+if TYPE_CHECKING:  # bs4 and httpx are imported where they are first needed.
+    import httpx
+    from bs4 import BeautifulSoup, Tag
+
+try:  # Optional speedups, installed with the "fast" extra.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - depends on the environment
+    LexborHTMLParser = None
 
 DEFAULT_HEADERS = {
     "User-Agent": "WebAnalyzerCLI/2.0 (+https://github.com/N1ghthill/web-analyzer-cli)",
+    # Only advertise the encodings urllib3 can actually decode here
+    # (br/zstd are added when the optional decoders are installed).
+    "Accept-Encoding": ACCEPT_ENCODING,
 }
 
 DEFAULT_WEIGHTS = {
@@ -22,19 +52,93 @@ DEFAULT_WEIGHTS = {
     "accessibility": 15,
     "best_practices": 10,
 }
+_DEFAULT_WEIGHT_ITEMS = tuple(DEFAULT_WEIGHTS.items())
+_DEFAULT_WEIGHT_TOTAL = sum(DEFAULT_WEIGHTS.values())
 
-SECURITY_HEADERS = [
+# A tuple rather than a set: missing headers are reported in this order.
+SECURITY_HEADERS = (
     "strict-transport-security",
     "content-security-policy",
     "x-content-type-options",
     "x-frame-options",
     "referrer-policy",
     "permissions-policy",
-]
+)
 
 DEPRECATED_TAGS = {"marquee", "center", "font", "blink"}
 
 
+@lru_cache(maxsize=None)
+def _select_parser() -> str:
+    """Prefer the C-backed lxml parser, falling back to the stdlib one."""
+    from bs4 import BeautifulSoup, FeatureNotFound
+
+    try:
+        BeautifulSoup("", "lxml")
+    except FeatureNotFound:
+        return "html.parser"
+    return "lxml"
+
+
+# Pages are read in chunks and cut off past this size, so a huge or
+# endless response cannot dominate parse time or exhaust memory.
+MAX_HTML_BYTES = 5 * 1024 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+def _is_markup(content_type: str) -> bool:
+    """Whether a Content-Type may carry a page worth parsing.
+
+    Bodies of other types (images, PDFs, SVG, feeds...) are not downloaded; a
+    missing header is given the benefit of the doubt.
+    """
+    media_type = content_type.partition(";")[0].strip().lower()
+    return not media_type or media_type.startswith("text/") or media_type == "application/xhtml+xml"
+
+
+def _build_session() -> requests.Session:
+    """Shared session so keep-alive connections are reused across fetches."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        # No connect retries: a host that does not answer must fail within
+        # one ``timeout`` rather than once per attempt plus backoff.
+        max_retries=Retry(total=2, connect=0, read=False, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+
+def close_http_session() -> None:
+    """Drop the pooled keep-alive connections; later fetches open new ones."""
+    _SESSION.close()
+
+
+# (second, formatted ISO prefix) of the last timestamp taken.
+_UTCNOW_CACHE = (-1, "")
+
+
+def _utcnow() -> str:
+    """Current UTC time as ISO 8601 with microseconds and a ``Z`` suffix.
+
+    The date and time part is formatted at most once per second.
+    """
+    global _UTCNOW_CACHE
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _UTCNOW_CACHE
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _UTCNOW_CACHE = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}Z"
+
+
+@lru_cache(maxsize=4096)
 def normalize_url(url: str) -> str:
     """Ensure URL has a scheme."""
     url = (url or "").strip()
@@ -45,15 +149,29 @@ def normalize_url(url: str) -> str:
     return url
 
 
+@lru_cache(maxsize=4096)
+def parse_normalized_url(url: str) -> Tuple[str, ParseResult]:
+    """Return ``normalize_url(url)`` and its parsed components, computed once per URL."""
+    normalized = normalize_url(url)
+    return normalized, urlparse(normalized)
+
+
 def _clamp_score(value: float) -> float:
     return round(max(0.0, min(100.0, float(value))), 2)
 
 
-def _score_by_threshold(value: float, thresholds: List[tuple]) -> float:
-    for limit, score in thresholds:
-        if value <= limit:
-            return score
-    return thresholds[-1][1]
+# Threshold tables: the score at index i applies while value <= limits[i].
+_RESPONSE_TIME_LIMITS = (0.4, 0.8, 1.2, 2.0, 3.0, 9999.0)
+_RESPONSE_TIME_SCORES = (100, 90, 80, 65, 45, 20)
+_CONTENT_SIZE_KB_LIMITS = (500, 1024, 2048, 3072, 999999)
+_CONTENT_SIZE_KB_SCORES = (100, 85, 65, 45, 20)
+_REQUEST_COUNT_LIMITS = (25, 50, 80, 120, 99999)
+_REQUEST_COUNT_SCORES = (100, 80, 60, 40, 20)
+
+
+def _score_by_threshold(value: float, limits: Tuple[float, ...], scores: Tuple[int, ...]) -> float:
+    index = bisect_left(limits, value)
+    return scores[min(index, len(scores) - 1)]
 
 
 def calculate_overall_score(
@@ -61,6 +179,14 @@ def calculate_overall_score(
     weights: Optional[Dict[str, int]] = None,
 ) -> float:
     """Return weighted score between 0 and 100."""
+    if (not weights or weights is DEFAULT_WEIGHTS) and len(criteria_scores) == len(_DEFAULT_WEIGHT_ITEMS):
+        try:
+            weighted_sum = sum(criteria_scores[name] * weight for name, weight in _DEFAULT_WEIGHT_ITEMS)
+        except KeyError:
+            pass
+        else:
+            return _clamp_score(weighted_sum / _DEFAULT_WEIGHT_TOTAL)
+
     used_weights = weights or DEFAULT_WEIGHTS
     total_weight = 0
     weighted_sum = 0.0
@@ -77,122 +203,451 @@ def calculate_overall_score(
     return _clamp_score(weighted_sum / total_weight)
 
 
-def _fetch_url(url: str, timeout: int = 10) -> Dict[str, Any]:
-    started_at = time.time()
-    response = requests.get(url, timeout=timeout, headers=DEFAULT_HEADERS, allow_redirects=True)
-    elapsed = time.time() - started_at
+def _decode_body(body: bytes, encoding: Optional[str]) -> str:
+    try:
+        return body.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
 
+def _fetched_page(
+    response: Any,
+    body: bytes,
+    elapsed: float,
+    truncated: bool,
+    skipped: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Page dict for a response; ``skipped`` names why its body was not read."""
     return {
-        "response": response,
+        "html": _decode_body(body, response.encoding),
+        "encoding": response.encoding,
         "elapsed": elapsed,
-        "final_url": response.url,
+        "final_url": str(response.url),
         "status": response.status_code,
         "headers": {k.lower(): v for k, v in response.headers.items()},
-        "content_size_bytes": len(response.content or b""),
+        "content_size_bytes": len(body),
+        "truncated": truncated,
+        "skipped": skipped,
     }
 
 
-def _extract_basic_html_stats(html: str) -> Dict[str, Any]:
-    soup = BeautifulSoup(html, "html.parser")
+def _conditional_headers(cached: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Request headers that let the server answer 304 for a stored page."""
+    if cached is None:
+        return DEFAULT_HEADERS
+    headers = dict(DEFAULT_HEADERS)
+    if cached["etag"]:
+        headers["If-None-Match"] = cached["etag"]
+    if cached["last_modified"]:
+        headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
 
-    title = soup.title.string.strip() if soup.title and soup.title.string else None
-    images = soup.find_all("img")
-    links = soup.find_all("a")
-    viewport = bool(soup.find("meta", attrs={"name": "viewport"}))
-    charset_meta = soup.find("meta", attrs={"charset": True})
 
+def _cached_page(cached: Dict[str, Any], elapsed: float) -> Dict[str, Any]:
+    body = cached["body"]
     return {
-        "soup": soup,
-        "title": title,
-        "images": len(images),
-        "links": len(links),
-        "mobile_friendly": viewport,
-        "meta_charset": charset_meta.get("charset") if charset_meta else None,
+        "html": _decode_body(body, cached["encoding"]),
+        "encoding": cached["encoding"],
+        "elapsed": elapsed,
+        "final_url": cached["final_url"],
+        "status": 200,
+        "headers": cached["headers"],
+        "content_size_bytes": len(body),
+        "truncated": False,
+        "skipped": None,
     }
 
 
-def _estimate_request_count(soup: BeautifulSoup) -> int:
-    total = 0
-    total += len(soup.find_all("script", src=True))
-    total += len(soup.find_all("img", src=True))
-    total += len(soup.find_all("link", href=True))
-    total += len(soup.find_all("iframe", src=True))
-    return total
+def _remember_page(store: AuditStore, url: str, fetched: Dict[str, Any], body: bytes) -> None:
+    """Keep complete 200 responses that carry a validator for later revalidation."""
+    headers = fetched["headers"]
+    if fetched["status"] != 200 or fetched["truncated"] or fetched["skipped"]:
+        return
+    if "etag" not in headers and "last-modified" not in headers:
+        return
+    store.put_page(url, fetched["final_url"], headers, fetched["encoding"], body)
 
 
-def _image_alt_coverage(soup: BeautifulSoup) -> float:
-    images = soup.find_all("img")
-    if not images:
-        return 1.0
-    with_alt = 0
-    for img in images:
-        alt = (img.get("alt") or "").strip()
-        if alt:
-            with_alt += 1
-    return with_alt / len(images)
-
-
-def _form_label_coverage(soup: BeautifulSoup) -> float:
-    fields = []
-    for field in soup.find_all(["input", "select", "textarea"]):
-        field_type = (field.get("type") or "").lower()
-        if field.name == "input" and field_type in {"hidden", "submit", "button", "reset", "image"}:
-            continue
-        fields.append(field)
+def _fetch_url(
+    url: str,
+    timeout: int = 10,
+    max_bytes: int = MAX_HTML_BYTES,
+    store: Optional[AuditStore] = None,
+) -> Dict[str, Any]:
+    cached = store.get_page(url) if store is not None else None
+    started_at = time.perf_counter()
+    response = _SESSION.get(
+        url,
+        timeout=timeout,
+        headers=_conditional_headers(cached),
+        allow_redirects=True,
+        stream=True,
+    )
+    try:
+        if cached is not None and response.status_code == 304:
+            store.touch_page(url)
+            return _cached_page(cached, time.perf_counter() - started_at)
+        body = bytearray()
+        truncated = False
+        skipped = None if _is_markup(response.headers.get("content-type", "")) else "not_markup"
+        if skipped is None:
+            for chunk in response.iter_content(chunk_size=_READ_CHUNK_BYTES):
+                body.extend(chunk)
+                if len(body) > max_bytes:
+                    del body[max_bytes:]
+                    truncated = True
+                    break
+    finally:
+        response.close()
+    elapsed = time.perf_counter() - started_at
+
+    payload = bytes(body)
+    fetched = _fetched_page(response, payload, elapsed, truncated, skipped)
+    if store is not None:
+        _remember_page(store, url, fetched, payload)
+    return fetched
+
+
+_MIXED_CONTENT_ATTRS = {
+    "script": "src",
+    "img": "src",
+    "iframe": "src",
+    "link": "href",
+    "video": "src",
+    "audio": "src",
+    "source": "src",
+}
 
-    if not fields:
-        return 1.0
+_REQUEST_ATTRS = {
+    "script": "src",
+    "img": "src",
+    "link": "href",
+    "iframe": "src",
+}
 
-    labelled = 0
-    for field in fields:
-        if (field.get("aria-label") or "").strip():
-            labelled += 1
-            continue
-        if (field.get("title") or "").strip():
-            labelled += 1
-            continue
-        field_id = (field.get("id") or "").strip()
-        if field_id and soup.find("label", attrs={"for": field_id}):
-            labelled += 1
-            continue
-        if field.find_parent("label") is not None:
-            labelled += 1
+_HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+
+_SKIPPED_INPUT_TYPES = {"hidden", "submit", "button", "reset", "image"}
+
+# Cheap scans over the lowercased markup; when they find nothing the
+# matching per-tag checks can be skipped during the tree walk.
+_FAST_MIXED_RE = re.compile(r"""(?:src|href)\s*=\s*["']?\s*http://""")
+_FAST_DEPRECATED_RE = re.compile(r"<(?:%s)\b" % "|".join(sorted(DEPRECATED_TAGS)))
+_FAST_BLANK_MARKER = "_blank"
+
+_DOCTYPE_RE = re.compile(r"\s*<!doctype html", re.IGNORECASE)
+
+# Tag scanners for the basic report, which never builds a DOM. Tag and
+# attribute names are case-insensitive; attribute values are compared as-is.
+_FAST_TITLE_RE = re.compile(r"<(?i:title)\b[^>]*>(.*?)</(?i:title)\s*>", re.DOTALL)
+_FAST_IMG_RE = re.compile(r"<(?i:img)\b")
+_FAST_LINK_RE = re.compile(r"<(?i:a)\b")
+_FAST_META_RE = re.compile(r"""<(?i:meta)\b((?:[^>"']|"[^"]*"|'[^']*')*)>""")
+_FAST_ATTR_RE = re.compile(r"""([^\s=/>"']+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>"']+)))?""")
+# Comments and script/style bodies hold no elements for the parser, so the
+# scan drops them first; an unterminated one runs to the end of the page.
+_FAST_SKIP_RE = re.compile(
+    r"<!--.*?(?:-->|\Z)"
+    r"|<(?i:script)\b[^>]*>.*?(?:</(?i:script)\s*>|\Z)"
+    r"|<(?i:style)\b[^>]*>.*?(?:</(?i:style)\s*>|\Z)",
+    re.DOTALL,
+)
+
+
+@dataclass
+class DomStats:
+    """Per-document counters gathered in a single walk of the parse tree."""
+
+    title: Optional[str] = None
+    lang: str = ""
+    doctype_ok: bool = False
+    has_viewport: bool = False
+    meta_charset: Optional[str] = None
+    meta_description: str = ""
+    has_robots: bool = False
+    has_canonical: bool = False
+    has_favicon: bool = False
+    has_schema_org: bool = False
+    images: int = 0
+    images_with_alt: int = 0
+    links: int = 0
+    request_count: int = 0
+    insecure_subresources: int = 0
+    insecure_blank_links: int = 0
+    deprecated_tags: int = 0
+    heading_levels: List[int] = field(default_factory=list)
+    form_fields: int = 0
+    labelled_fields: int = 0
+    buttons: int = 0
+    accessible_buttons: int = 0
+
+
+_DOM_STATS_FIELDS = frozenset(item.name for item in fields(DomStats))
+
+
+_CANONICAL_RE = re.compile(r"(?:^|\s)canonical(?:\s|$)", re.IGNORECASE)
+_ICON_RE = re.compile(r"icon", re.IGNORECASE)
+_NOOPENER_RE = re.compile(r"noopener|noreferrer", re.IGNORECASE)
+
+
+def _rel_text(attrs: Dict[str, Any]) -> str:
+    rel = attrs.get("rel") or ""
+    if isinstance(rel, str):
+        return rel
+    return " ".join(rel)
+
+
+class _SoupBackend:
+    """Tree access for BeautifulSoup documents."""
+
+    @staticmethod
+    def elements(soup: BeautifulSoup) -> Iterator[Tuple[str, Dict[str, Any], Any]]:
+        from bs4 import Tag
+
+        for tag in soup.descendants:
+            if isinstance(tag, Tag):
+                yield tag.name, tag.attrs, tag
+
+    @staticmethod
+    def title_text(tag: Tag) -> Optional[str]:
+        return tag.string
+
+    @staticmethod
+    def inside_label(tag: Tag) -> bool:
+        return tag.find_parent("label") is not None
+
+    @staticmethod
+    def text(tag: Tag) -> str:
+        return tag.get_text(" ", strip=True)
+
+
+class _LexborBackend:
+    """Tree access for selectolax Lexbor documents."""
+
+    @staticmethod
+    def elements(tree: Any) -> Iterator[Tuple[str, Dict[str, Any], Any]]:
+        root = tree.root
+        if root is None:
+            return
+        for node in root.traverse():
+            yield node.tag, node.attributes, node
+
+    @staticmethod
+    def title_text(node: Any) -> Optional[str]:
+        return node.text()
+
+    @staticmethod
+    def inside_label(node: Any) -> bool:
+        parent = node.parent
+        while parent is not None:
+            if parent.tag == "label":
+                return True
+            parent = parent.parent
+        return False
+
+    @staticmethod
+    def text(node: Any) -> str:
+        return node.text(separator=" ", strip=True)
+
+
+def _collect_dom_stats(
+    tree: Any,
+    check_mixed: bool = True,
+    check_blank: bool = True,
+    check_deprecated: bool = True,
+    backend: Any = _SoupBackend,
+) -> DomStats:
+    stats = DomStats()
+    form_fields: List[Tuple[Dict[str, Any], Any]] = []
+    label_targets: Set[str] = set()
+    buttons: List[Tuple[str, Dict[str, Any], Any]] = []
+    seen_title = False
+    seen_html = False
+    seen_description = False
+
+    for name, attrs, node in backend.elements(tree):
+        request_attr = _REQUEST_ATTRS.get(name)
+        if request_attr and request_attr in attrs:
+            stats.request_count += 1
+
+        mixed_attr = _MIXED_CONTENT_ATTRS.get(name) if check_mixed else None
+        if mixed_attr and (attrs.get(mixed_attr) or "").strip().startswith("http://"):
+            stats.insecure_subresources += 1
+
+        if check_deprecated and name in DEPRECATED_TAGS:
+            stats.deprecated_tags += 1
+        elif name in _HEADING_TAGS:
+            stats.heading_levels.append(int(name[1]))
+        elif name == "img":
+            stats.images += 1
+            if (attrs.get("alt") or "").strip():
+                stats.images_with_alt += 1
+        elif name == "a":
+            stats.links += 1
+            target = attrs.get("target") if check_blank else None
+            if target is not None and target.lower() == "_blank":
+                if _NOOPENER_RE.search(_rel_text(attrs)) is None:
+                    stats.insecure_blank_links += 1
+        elif name == "meta":
+            meta_name = attrs.get("name")
+            if meta_name == "viewport":
+                stats.has_viewport = True
+            elif meta_name == "description" and not seen_description:
+                seen_description = True
+                stats.meta_description = (attrs.get("content") or "").strip()
+            elif meta_name == "robots":
+                stats.has_robots = True
+            if stats.meta_charset is None and "charset" in attrs:
+                stats.meta_charset = attrs.get("charset") or ""
+        elif name == "link":
+            rel_text = _rel_text(attrs)
+            if _CANONICAL_RE.search(rel_text):
+                stats.has_canonical = True
+            if _ICON_RE.search(rel_text):
+                stats.has_favicon = True
+        elif name == "script":
+            if attrs.get("type") == "application/ld+json":
+                stats.has_schema_org = True
+        elif name == "title":
+            if not seen_title:
+                seen_title = True
+                title = backend.title_text(node)
+                if title:
+                    stats.title = title.strip()
+        elif name == "html":
+            if not seen_html:
+                seen_html = True
+                stats.lang = (attrs.get("lang") or "").strip()
+        elif name == "label":
+            label_for = attrs.get("for")
+            if label_for:
+                label_targets.add(label_for)
+
+        if name == "input":
+            field_type = (attrs.get("type") or "").lower()
+            if field_type in {"button", "submit"}:
+                buttons.append((name, attrs, node))
+            if field_type not in _SKIPPED_INPUT_TYPES:
+                form_fields.append((attrs, node))
+        elif name in {"select", "textarea"}:
+            form_fields.append((attrs, node))
+        elif name == "button":
+            buttons.append((name, attrs, node))
+
+    stats.form_fields = len(form_fields)
+    stats.labelled_fields = sum(
+        1 for attrs, node in form_fields if _is_labelled(attrs, node, label_targets, backend)
+    )
+    stats.buttons = len(buttons)
+    stats.accessible_buttons = sum(
+        1 for name, attrs, node in buttons if _is_accessible_button(name, attrs, node, backend)
+    )
+    return stats
 
-    return labelled / len(fields)
+
+def _is_labelled(attrs: Dict[str, Any], node: Any, label_targets: Set[str], backend: Any) -> bool:
+    return bool(
+        (attrs.get("aria-label") or "").strip()
+        or (attrs.get("title") or "").strip()
+        or (attrs.get("id") or "").strip() in label_targets
+        or backend.inside_label(node)
+    )
 
 
-def _button_accessibility_coverage(soup: BeautifulSoup) -> float:
-    button_candidates = list(soup.find_all("button"))
-    button_candidates.extend(
-        soup.find_all("input", attrs={"type": lambda x: (x or "").lower() in {"button", "submit"}})
+def _is_accessible_button(name: str, attrs: Dict[str, Any], node: Any, backend: Any) -> bool:
+    # Attribute checks come first so the text is only extracted for unlabelled buttons.
+    return bool(
+        (attrs.get("aria-label") or "").strip()
+        or (attrs.get("title") or "").strip()
+        or (backend.text(node) if name == "button" else (attrs.get("value") or "").strip())
     )
 
-    if not button_candidates:
+
+def _extract_basic_html_stats(html: str, fast: bool = False) -> DomStats:
+    """Parse ``html`` once and collect its DomStats.
+
+    With ``fast`` set and selectolax installed, the Lexbor parser is used
+    instead of BeautifulSoup; the counters are the same, but Lexbor follows
+    the HTML5 tree-building rules, so broken markup can nest differently.
+    """
+    html_lower = html.lower()
+    if fast and LexborHTMLParser is not None:
+        tree, backend = LexborHTMLParser(html), _LexborBackend
+    else:
+        from bs4 import BeautifulSoup
+
+        tree, backend = BeautifulSoup(html, _select_parser()), _SoupBackend
+    stats = _collect_dom_stats(
+        tree,
+        check_mixed=_FAST_MIXED_RE.search(html_lower) is not None,
+        check_blank=_FAST_BLANK_MARKER in html_lower,
+        check_deprecated=_FAST_DEPRECATED_RE.search(html_lower) is not None,
+        backend=backend,
+    )
+    stats.doctype_ok = _DOCTYPE_RE.match(html) is not None
+    return stats
+
+
+def _fast_tag_attrs(raw: str) -> Dict[str, str]:
+    attrs: Dict[str, str] = {}
+    for match in _FAST_ATTR_RE.finditer(raw):
+        name = match.group(1).lower()
+        if name not in attrs:
+            value = next((group for group in match.groups()[1:] if group is not None), "")
+            attrs[name] = html_lib.unescape(value)
+    return attrs
+
+
+def _fast_basic_stats(html: str) -> DomStats:
+    """Collect the basic report fields by scanning tags, without a DOM parse.
+
+    The returned stats are partial and must not be scored or cached. Tags in
+    comments, scripts and styles are skipped, as the parser does, so the
+    counts agree with full DomStats reused for a basic run.
+    """
+    stats = DomStats()
+    html = _FAST_SKIP_RE.sub(" ", html)
+    title_match = _FAST_TITLE_RE.search(html)
+    if title_match:
+        title = html_lib.unescape(title_match.group(1))
+        if title:
+            stats.title = title.strip()
+    stats.images = len(_FAST_IMG_RE.findall(html))
+    stats.links = len(_FAST_LINK_RE.findall(html))
+    for meta_match in _FAST_META_RE.finditer(html):
+        attrs = _fast_tag_attrs(meta_match.group(1))
+        if attrs.get("name") == "viewport":
+            stats.has_viewport = True
+        if stats.meta_charset is None and "charset" in attrs:
+            stats.meta_charset = attrs["charset"]
+        if stats.has_viewport and stats.meta_charset is not None:
+            break
+    return stats
+
+
+def _image_alt_coverage(stats: DomStats) -> float:
+    if not stats.images:
         return 1.0
+    return stats.images_with_alt / stats.images
 
-    accessible = 0
-    for button in button_candidates:
-        label = ""
-        if button.name == "button":
-            label = (button.get_text(" ", strip=True) or "").strip()
-        else:
-            label = (button.get("value") or "").strip()
 
-        aria = (button.get("aria-label") or "").strip()
-        title = (button.get("title") or "").strip()
+def _form_label_coverage(stats: DomStats) -> float:
+    if not stats.form_fields:
+        return 1.0
+    return stats.labelled_fields / stats.form_fields
 
-        if label or aria or title:
-            accessible += 1
 
-    return accessible / len(button_candidates)
+def _button_accessibility_coverage(stats: DomStats) -> float:
+    if not stats.buttons:
+        return 1.0
+    return stats.accessible_buttons / stats.buttons
 
 
-def _heading_order_score(soup: BeautifulSoup) -> float:
-    headings = soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])
-    if not headings:
+def _heading_order_score(stats: DomStats) -> float:
+    levels = stats.heading_levels
+    if not levels:
         return 0.6
 
-    levels = [int(tag.name[1]) for tag in headings]
     jumps = 0
     previous = levels[0]
     for level in levels[1:]:
@@ -210,67 +665,18 @@ def _heading_order_score(soup: BeautifulSoup) -> float:
     return 0.2
 
 
-def _has_mixed_content(soup: BeautifulSoup, page_is_https: bool) -> int:
+def _has_mixed_content(stats: DomStats, page_is_https: bool) -> int:
     if not page_is_https:
         return 0
-
-    mixed = 0
-    selectors = [
-        ("script", "src"),
-        ("img", "src"),
-        ("iframe", "src"),
-        ("link", "href"),
-        ("video", "src"),
-        ("audio", "src"),
-        ("source", "src"),
-    ]
-
-    for tag_name, attr in selectors:
-        for tag in soup.find_all(tag_name):
-            raw = (tag.get(attr) or "").strip()
-            if raw.startswith("http://"):
-                mixed += 1
-
-    return mixed
-
-
-def _target_blank_without_rel_count(soup: BeautifulSoup) -> int:
-    count = 0
-    for anchor in soup.find_all("a", target=True):
-        if (anchor.get("target") or "").lower() != "_blank":
-            continue
-        rel_tokens = " ".join(anchor.get("rel") or []).lower()
-        if "noopener" not in rel_tokens and "noreferrer" not in rel_tokens:
-            count += 1
-    return count
+    return stats.insecure_subresources
 
 
 def _score_performance(response_time: float, content_size_bytes: int, request_count: int) -> Dict[str, Any]:
-    response_score = _score_by_threshold(response_time, [
-        (0.4, 100),
-        (0.8, 90),
-        (1.2, 80),
-        (2.0, 65),
-        (3.0, 45),
-        (9999.0, 20),
-    ])
+    response_score = _score_by_threshold(response_time, _RESPONSE_TIME_LIMITS, _RESPONSE_TIME_SCORES)
 
     content_size_kb = content_size_bytes / 1024 if content_size_bytes else 0
-    size_score = _score_by_threshold(content_size_kb, [
-        (500, 100),
-        (1024, 85),
-        (2048, 65),
-        (3072, 45),
-        (999999, 20),
-    ])
-
-    request_score = _score_by_threshold(request_count, [
-        (25, 100),
-        (50, 80),
-        (80, 60),
-        (120, 40),
-        (99999, 20),
-    ])
+    size_score = _score_by_threshold(content_size_kb, _CONTENT_SIZE_KB_LIMITS, _CONTENT_SIZE_KB_SCORES)
+    request_score = _score_by_threshold(request_count, _REQUEST_COUNT_LIMITS, _REQUEST_COUNT_SCORES)
 
     final_score = _clamp_score((response_score * 0.55) + (size_score * 0.25) + (request_score * 0.20))
     method = "local"
@@ -301,16 +707,12 @@ def _score_security(url: str, headers: Dict[str, str]) -> Dict[str, Any]:
 
     points = 0
     max_points = 100
-    missing_headers: List[str] = []
+    missing_headers = [header for header in SECURITY_HEADERS if header not in headers]
 
     if is_https:
         points += 20
 
-    for header in SECURITY_HEADERS:
-        if header in headers:
-            points += 10
-        else:
-            missing_headers.append(header)
+    points += 10 * (len(SECURITY_HEADERS) - len(missing_headers))
 
     set_cookie = (headers.get("set-cookie") or "").lower()
     if not set_cookie:
@@ -347,20 +749,11 @@ def _score_security(url: str, headers: Dict[str, str]) -> Dict[str, Any]:
     }
 
 
-def _score_seo(soup: BeautifulSoup) -> Dict[str, Any]:
-    title_text = ""
-    if soup.title and soup.title.string:
-        title_text = soup.title.string.strip()
-
-    meta_description_tag = soup.find("meta", attrs={"name": "description"})
-    meta_description = (meta_description_tag.get("content") or "").strip() if meta_description_tag else ""
-
-    robots_tag = soup.find("meta", attrs={"name": "robots"})
-    canonical_tag = soup.find("link", attrs={"rel": lambda v: v and "canonical" in [x.lower() for x in (v if isinstance(v, list) else [v])]})
-    lang = (soup.html.get("lang") or "").strip() if soup.html else ""
-    h1_count = len(soup.find_all("h1"))
-    alt_coverage = _image_alt_coverage(soup)
-    has_schema = bool(soup.find("script", attrs={"type": "application/ld+json"}))
+def _score_seo(stats: DomStats) -> Dict[str, Any]:
+    title_text = stats.title or ""
+    meta_description = stats.meta_description
+    h1_count = stats.heading_levels.count(1)
+    alt_coverage = _image_alt_coverage(stats)
 
     points = 0
 
@@ -374,13 +767,13 @@ def _score_seo(soup: BeautifulSoup) -> Dict[str, Any]:
     elif meta_description:
         points += 10
 
-    if canonical_tag:
+    if stats.has_canonical:
         points += 10
 
-    if robots_tag:
+    if stats.has_robots:
         points += 10
 
-    if lang:
+    if stats.lang:
         points += 10
 
     if h1_count == 1:
@@ -395,7 +788,7 @@ def _score_seo(soup: BeautifulSoup) -> Dict[str, Any]:
     elif alt_coverage > 0:
         points += 3
 
-    if has_schema:
+    if stats.has_schema_org:
         points += 5
 
     final_score = _clamp_score(points)
@@ -415,23 +808,23 @@ def _score_seo(soup: BeautifulSoup) -> Dict[str, Any]:
         "details": {
             "title_length": len(title_text),
             "meta_description_length": len(meta_description),
-            "has_canonical": bool(canonical_tag),
-            "has_robots": bool(robots_tag),
-            "lang": lang,
+            "has_canonical": stats.has_canonical,
+            "has_robots": stats.has_robots,
+            "lang": stats.lang,
             "h1_count": h1_count,
             "image_alt_coverage": round(alt_coverage, 3),
-            "has_schema_org": has_schema,
+            "has_schema_org": stats.has_schema_org,
             "notes": notes,
         },
     }
 
 
-def _score_accessibility(soup: BeautifulSoup) -> Dict[str, Any]:
-    lang_ok = bool((soup.html.get("lang") or "").strip()) if soup.html else False
-    img_alt_coverage = _image_alt_coverage(soup)
-    form_label_coverage = _form_label_coverage(soup)
-    button_accessibility = _button_accessibility_coverage(soup)
-    heading_structure = _heading_order_score(soup)
+def _score_accessibility(stats: DomStats) -> Dict[str, Any]:
+    lang_ok = bool(stats.lang)
+    img_alt_coverage = _image_alt_coverage(stats)
+    form_label_coverage = _form_label_coverage(stats)
+    button_accessibility = _button_accessibility_coverage(stats)
+    heading_structure = _heading_order_score(stats)
 
     final_score = _clamp_score(
         (20 if lang_ok else 0)
@@ -464,20 +857,13 @@ def _score_accessibility(soup: BeautifulSoup) -> Dict[str, Any]:
     }
 
 
-def _score_best_practices(soup: BeautifulSoup, html: str, final_url: str) -> Dict[str, Any]:
-    doctype_ok = html.lstrip().lower().startswith("<!doctype html")
+def _score_best_practices(stats: DomStats, final_url: str) -> Dict[str, Any]:
+    doctype_ok = stats.doctype_ok
     is_https = urlparse(final_url).scheme == "https"
-    mixed_content_items = _has_mixed_content(soup, is_https)
-    deprecated_count = sum(len(soup.find_all(tag)) for tag in DEPRECATED_TAGS)
-    favicon_ok = bool(
-        soup.find(
-            "link",
-            attrs={
-                "rel": lambda v: v and any("icon" in item.lower() for item in (v if isinstance(v, list) else [v]))
-            },
-        )
-    )
-    insecure_blank_links = _target_blank_without_rel_count(soup)
+    mixed_content_items = _has_mixed_content(stats, is_https)
+    deprecated_count = stats.deprecated_tags
+    favicon_ok = stats.has_favicon
+    insecure_blank_links = stats.insecure_blank_links
 
     points = 0
     if doctype_ok:
@@ -516,183 +902,381 @@ def _score_best_practices(soup: BeautifulSoup, html: str, final_url: str) -> Dic
     }
 
 
-def run_basic_analysis(url: str, timeout: int = 10) -> Dict[str, Any]:
-    """Return basic website checks without full scoring."""
-    normalized = normalize_url(url)
-    timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+def _error_result(mode: str, timestamp: str, url: str, error: str) -> Dict[str, Any]:
+    return {
+        "mode": mode,
+        "timestamp": timestamp,
+        "url": url,
+        "error": error,
+    }
 
+
+def _basic_result(url: str, timestamp: str, fetched: Dict[str, Any], stats: DomStats) -> Dict[str, Any]:
+    return {
+        "mode": "basic",
+        "timestamp": timestamp,
+        "url": url,
+        "final_url": fetched["final_url"],
+        "status": fetched["status"],
+        "response_time_s": round(fetched["elapsed"], 3),
+        "title": stats.title,
+        "images": stats.images,
+        "links": stats.links,
+        "mobile_friendly": stats.has_viewport,
+        "charset": stats.meta_charset or fetched["encoding"],
+        "content_size_bytes": fetched["content_size_bytes"],
+        "error": None,
+    }
+
+
+def _full_result(url: str, timestamp: str, fetched: Dict[str, Any], stats: DomStats) -> Dict[str, Any]:
+    estimated_request_count = stats.request_count
+
+    criteria = {
+        "performance": _score_performance(
+            response_time=fetched["elapsed"],
+            content_size_bytes=fetched["content_size_bytes"],
+            request_count=estimated_request_count,
+        ),
+        "security": _score_security(fetched["final_url"], fetched["headers"]),
+        "seo": _score_seo(stats),
+        "accessibility": _score_accessibility(stats),
+        "best_practices": _score_best_practices(
+            stats=stats,
+            final_url=fetched["final_url"],
+        ),
+    }
+
+    criteria_scores = {name: data["score"] for name, data in criteria.items()}
+    overall_score = calculate_overall_score(criteria_scores, DEFAULT_WEIGHTS)
+
+    return {
+        "mode": "full",
+        "timestamp": timestamp,
+        "url": url,
+        "final_url": fetched["final_url"],
+        "status": fetched["status"],
+        "response_time_s": round(fetched["elapsed"], 3),
+        "title": stats.title,
+        "images": stats.images,
+        "links": stats.links,
+        "mobile_friendly": stats.has_viewport,
+        "charset": stats.meta_charset or fetched["encoding"],
+        "content_size_bytes": fetched["content_size_bytes"],
+        "estimated_request_count": estimated_request_count,
+        "criteria": criteria,
+        "weights": DEFAULT_WEIGHTS,
+        "overall_score": overall_score,
+        "error": None,
+    }
+
+
+def _score_html(
+    url: str,
+    timestamp: str,
+    fetched: Dict[str, Any],
+    full: bool,
+    stats: Optional[DomStats] = None,
+) -> Dict[str, Any]:
+    """Build the result for a fetched page, parsing it unless ``stats`` is given."""
     try:
-        fetched = _fetch_url(normalized, timeout=timeout)
-        response = fetched["response"]
-        html = response.text or ""
-        parsed = _extract_basic_html_stats(html)
-
-        return {
-            "mode": "basic",
-            "timestamp": timestamp,
-            "url": normalized,
-            "final_url": fetched["final_url"],
-            "status": fetched["status"],
-            "response_time_s": round(fetched["elapsed"], 3),
-            "title": parsed["title"],
-            "images": parsed["images"],
-            "links": parsed["links"],
-            "mobile_friendly": parsed["mobile_friendly"],
-            "charset": parsed["meta_charset"] or response.encoding,
-            "content_size_bytes": fetched["content_size_bytes"],
-            "error": None,
-        }
-    except requests.exceptions.Timeout:
-        return {
-            "mode": "basic",
-            "timestamp": timestamp,
-            "url": normalized,
-            "error": "timeout",
-        }
-    except requests.exceptions.ConnectionError:
-        return {
-            "mode": "basic",
-            "timestamp": timestamp,
-            "url": normalized,
-            "error": "connection_error",
-        }
+        if full:
+            if stats is None:
+                stats = _extract_basic_html_stats(fetched["html"])
+            return _full_result(url, timestamp, fetched, stats)
+        if stats is None:
+            stats = _fast_basic_stats(fetched["html"])
+        return _basic_result(url, timestamp, fetched, stats)
     except Exception as exc:  # pragma: no cover - defensive fallback
-        return {
-            "mode": "basic",
-            "timestamp": timestamp,
-            "url": normalized,
-            "error": str(exc),
-        }
+        return _error_result("full" if full else "basic", timestamp, url, str(exc))
+
+
+# Stage caches shared by basic and full runs in one session, so switching
+# mode on the same URL reuses the download and, when possible, the parse.
+# Kept bodies are capped by their total size, not only by their count.
+_FETCH_CACHE_MAX_CHARS = 32 * 1024 * 1024
+_FETCH_CACHE = TTLCache(
+    maxsize=128,
+    ttl=300,
+    maxweight=_FETCH_CACHE_MAX_CHARS,
+    weigh=lambda fetched: len(fetched["html"]),
+)
+_STATS_CACHE = TTLCache(maxsize=128, ttl=300)
+
+
+def is_cacheable_result(result: Dict[str, Any]) -> bool:
+    """Whether ``result`` may be reused: no error and a 2xx page.
+
+    Other statuses are often transient (a 503 during a deploy), so they are
+    fetched again on the next call.
+    """
+    return not result.get("error") and 200 <= result.get("status", 0) < 300
 
 
-def run_full_audit(url: str, timeout: int = 10) -> Dict[str, Any]:
-    """Run a complete quality audit with weighted scoring."""
+def _parse_stage(
+    url: str,
+    fetched: Dict[str, Any],
+    full: bool,
+    memoize: bool,
+    store: Optional[AuditStore] = None,
+) -> Optional[DomStats]:
+    """Return reusable full DomStats for the page, or None to let _score_html parse.
+
+    Full stats are a superset of what the basic report reads, so a basic run
+    reuses them when a full run already parsed the same content.
+    """
+    if not memoize and store is None:
+        return None
+    content_hash = content_digest(fetched["html"])
+    stats = _STATS_CACHE.get(content_hash) if memoize else None
+    if stats is None:
+        stats = _load_stats(store, url, content_hash)
+    if stats is None and full:
+        stats = _extract_basic_html_stats(fetched["html"])
+        if store is not None:
+            store.put(url, content_hash, asdict(stats))
+    if memoize and stats is not None:
+        _STATS_CACHE.set(content_hash, stats)
+    return stats
+
+
+def _analyze(
+    url: str,
+    timeout: int,
+    full: bool,
+    max_bytes: int,
+    store: Optional[AuditStore] = None,
+    memoize: bool = False,
+) -> Dict[str, Any]:
+    mode = "full" if full else "basic"
     normalized = normalize_url(url)
-    timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    timestamp = _utcnow()
+    fetch_key = (normalized, timeout, max_bytes)
+
+    fetched = _FETCH_CACHE.get(fetch_key) if memoize else None
+    if fetched is None:
+        try:
+            fetched = _fetch_url(normalized, timeout=timeout, max_bytes=max_bytes, store=store)
+        except requests.exceptions.Timeout:
+            return _error_result(mode, timestamp, normalized, "timeout")
+        except requests.exceptions.ConnectionError:
+            return _error_result(mode, timestamp, normalized, "connection_error")
+        except Exception as exc:  # pragma: no cover - defensive fallback
+            return _error_result(mode, timestamp, normalized, str(exc))
+        if memoize and 200 <= fetched["status"] < 300 and not fetched["skipped"]:
+            _FETCH_CACHE.set(fetch_key, fetched)
+
+    if fetched["skipped"]:
+        # Nothing was downloaded, so there is no page to parse or score.
+        return _error_result(mode, timestamp, normalized, fetched["skipped"])
 
     try:
-        fetched = _fetch_url(normalized, timeout=timeout)
-        response = fetched["response"]
-        html = response.text or ""
-        parsed_html = _extract_basic_html_stats(html)
-        soup = parsed_html["soup"]
-
-        estimated_request_count = _estimate_request_count(soup)
-
-        criteria = {
-            "performance": _score_performance(
-                response_time=fetched["elapsed"],
-                content_size_bytes=fetched["content_size_bytes"],
-                request_count=estimated_request_count,
-            ),
-            "security": _score_security(fetched["final_url"], fetched["headers"]),
-            "seo": _score_seo(soup),
-            "accessibility": _score_accessibility(soup),
-            "best_practices": _score_best_practices(
-                soup=soup,
-                html=html,
-                final_url=fetched["final_url"],
-            ),
-        }
-
-        criteria_scores = {name: data["score"] for name, data in criteria.items()}
-        overall_score = calculate_overall_score(criteria_scores, DEFAULT_WEIGHTS)
-
-        return {
-            "mode": "full",
-            "timestamp": timestamp,
-            "url": normalized,
-            "final_url": fetched["final_url"],
-            "status": fetched["status"],
-            "response_time_s": round(fetched["elapsed"], 3),
-            "title": parsed_html["title"],
-            "images": parsed_html["images"],
-            "links": parsed_html["links"],
-            "mobile_friendly": parsed_html["mobile_friendly"],
-            "charset": parsed_html["meta_charset"] or response.encoding,
-            "content_size_bytes": fetched["content_size_bytes"],
-            "estimated_request_count": estimated_request_count,
-            "criteria": criteria,
-            "weights": DEFAULT_WEIGHTS,
-            "overall_score": overall_score,
-            "error": None,
-        }
-    except requests.exceptions.Timeout:
-        return {
-            "mode": "full",
-            "timestamp": timestamp,
-            "url": normalized,
-            "error": "timeout",
-        }
-    except requests.exceptions.ConnectionError:
-        return {
-            "mode": "full",
-            "timestamp": timestamp,
-            "url": normalized,
-            "error": "connection_error",
-        }
+        stats = _parse_stage(normalized, fetched, full, memoize, store)
     except Exception as exc:  # pragma: no cover - defensive fallback
-        return {
-            "mode": "full",
-            "timestamp": timestamp,
-            "url": normalized,
-            "error": str(exc),
-        }
+        return _error_result(mode, timestamp, normalized, str(exc))
+    return _score_html(normalized, timestamp, fetched, full, stats=stats)
+
+
+def run_basic_analysis(
+    url: str,
+    timeout: int = 10,
+    max_bytes: int = MAX_HTML_BYTES,
+    store: Optional[AuditStore] = None,
+) -> Dict[str, Any]:
+    """Return basic website checks without full scoring."""
+    return _analyze(url, timeout, full=False, max_bytes=max_bytes, store=store)
+
+
+def run_full_audit(
+    url: str,
+    timeout: int = 10,
+    max_bytes: int = MAX_HTML_BYTES,
+    store: Optional[AuditStore] = None,
+) -> Dict[str, Any]:
+    """Run a complete quality audit with weighted scoring.
+
+    At most ``max_bytes`` of the page body are downloaded and analyzed. With a
+    ``store``, a previously fetched page is revalidated with a conditional GET
+    and its stored body is reused when the server answers 304.
+    """
+    return _analyze(url, timeout, full=True, max_bytes=max_bytes, store=store)
+
+
+async def _fetch_url_async(
+    client: httpx.AsyncClient,
+    url: str,
+    timeout: int = 10,
+    max_bytes: int = MAX_HTML_BYTES,
+    store: Optional[AuditStore] = None,
+) -> Dict[str, Any]:
+    cached = store.get_page(url) if store is not None else None
+    started_at = time.perf_counter()
+    async with client.stream("GET", url, timeout=timeout, headers=_conditional_headers(cached)) as response:
+        if cached is not None and response.status_code == 304:
+            store.touch_page(url)
+            return _cached_page(cached, time.perf_counter() - started_at)
+        body = bytearray()
+        truncated = False
+        skipped = None if _is_markup(response.headers.get("content-type", "")) else "not_markup"
+        if skipped is None:
+            async for chunk in response.aiter_bytes(_READ_CHUNK_BYTES):
+                body.extend(chunk)
+                if len(body) > max_bytes:
+                    del body[max_bytes:]
+                    truncated = True
+                    break
+    elapsed = time.perf_counter() - started_at
+
+    payload = bytes(body)
+    fetched = _fetched_page(response, payload, elapsed, truncated, skipped)
+    if store is not None:
+        _remember_page(store, url, fetched, payload)
+    return fetched
+
+
+_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared parse pool, starting it on first use."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+        atexit.register(_POOL.shutdown)
+    return _POOL
+
+
+async def run_batch_async(
+    urls: List[str],
+    full: bool = False,
+    timeout: int = 10,
+    concurrency: int = 32,
+    store: Optional[AuditStore] = None,
+) -> List[Dict[str, Any]]:
+    """Analyze many URLs with concurrent fetches; results keep input order.
+
+    Fetches share one pooled HTTP client bounded by ``concurrency``, and the
+    HTML parsing for full audits runs in a process pool shared across calls so
+    it spreads across cores; only the page text and the resulting stats cross
+    it. Basic runs without a store use the same regex scan as the sync path,
+    so both batch modes report the same counts. When a
+    ``store`` is given, stored pages are revalidated with conditional GETs and
+    pages whose content did not change since the last run reuse the stored
+    parse instead of being parsed again.
+    """
+    import httpx
+
+    mode = "full" if full else "basic"
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    pool = _get_process_pool()
+
+    async with httpx.AsyncClient(headers=DEFAULT_HEADERS, follow_redirects=True, limits=limits) as client:
+
+        async def audit(url: str) -> Dict[str, Any]:
+            normalized = normalize_url(url)
+            timestamp = _utcnow()
+
+            try:
+                async with semaphore:
+                    fetched = await _fetch_url_async(client, normalized, timeout=timeout, store=store)
+            except httpx.TimeoutException:
+                return _error_result(mode, timestamp, normalized, "timeout")
+            except httpx.NetworkError:
+                return _error_result(mode, timestamp, normalized, "connection_error")
+            except Exception as exc:  # pragma: no cover - defensive fallback
+                return _error_result(mode, timestamp, normalized, str(exc))
+
+            if fetched["skipped"]:
+                return _error_result(mode, timestamp, normalized, fetched["skipped"])
+
+            if not full and store is None:
+                # Same regex scan as the sync basic path; no DOM to build.
+                return _score_html(normalized, timestamp, fetched, full)
+
+            content_hash = content_digest(fetched["html"])
+            stats = _load_stats(store, normalized, content_hash)
+            if stats is None:
+                try:
+                    stats = await loop.run_in_executor(pool, _extract_basic_html_stats, fetched["html"], True)
+                except Exception as exc:  # pragma: no cover - defensive fallback
+                    return _error_result(mode, timestamp, normalized, str(exc))
+                if store is not None:
+                    store.put(normalized, content_hash, asdict(stats))
+
+            return _score_html(normalized, timestamp, fetched, full, stats=stats)
+
+        return list(await asyncio.gather(*(audit(url) for url in urls)))
+
+
+def _load_stats(store: Optional[AuditStore], url: str, content_hash: str) -> Optional[DomStats]:
+    if store is None:
+        return None
+    payload = store.get(url, content_hash)
+    if payload is None or set(payload) != _DOM_STATS_FIELDS:
+        # Missing, or stored by a release with a different DomStats layout.
+        return None
+    return DomStats(**payload)
+
+
+_SEP = "=" * 60
+_RULE = "-" * 60
+
+
+def _format_error_report(heading: str, result: Dict[str, Any]) -> str:
+    lines = [
+        "",
+        _SEP,
+        heading,
+        _SEP,
+        f"URL: {result.get('url')}",
+        f"Timestamp: {result.get('timestamp')}",
+        f"Error: {result.get('error')}",
+        _SEP,
+    ]
+    return "\n".join(lines) + "\n"
 
 
 def _format_basic_report(result: Dict[str, Any]) -> str:
     if result.get("error"):
-        return (
-            "\n" + "=" * 60 + "\n"
-            + "WEB ANALYZER - BASIC CHECK\n"
-            + "=" * 60 + "\n"
-            + f"URL: {result.get('url')}\n"
-            + f"Timestamp: {result.get('timestamp')}\n"
-            + f"Error: {result.get('error')}\n"
-            + "=" * 60 + "\n"
-        )
-
-    return (
-        "\n" + "=" * 60 + "\n"
-        + "WEB ANALYZER - BASIC CHECK\n"
-        + "=" * 60 + "\n"
-        + f"URL: {result.get('url')}\n"
-        + f"Final URL: {result.get('final_url')}\n"
-        + f"Timestamp: {result.get('timestamp')}\n"
-        + f"HTTP status: {result.get('status')}\n"
-        + f"Response time: {result.get('response_time_s')}s\n"
-        + f"Title: {result.get('title') or 'N/A'}\n"
-        + f"Images: {result.get('images')}\n"
-        + f"Links: {result.get('links')}\n"
-        + f"Mobile friendly (viewport): {'yes' if result.get('mobile_friendly') else 'no'}\n"
-        + f"Charset: {result.get('charset') or 'N/A'}\n"
-        + "=" * 60 + "\n"
-    )
+        return _format_error_report("WEB ANALYZER - BASIC CHECK", result)
+
+    lines = [
+        "",
+        _SEP,
+        "WEB ANALYZER - BASIC CHECK",
+        _SEP,
+        f"URL: {result.get('url')}",
+        f"Final URL: {result.get('final_url')}",
+        f"Timestamp: {result.get('timestamp')}",
+        f"HTTP status: {result.get('status')}",
+        f"Response time: {result.get('response_time_s')}s",
+        f"Title: {result.get('title') or 'N/A'}",
+        f"Images: {result.get('images')}",
+        f"Links: {result.get('links')}",
+        f"Mobile friendly (viewport): {'yes' if result.get('mobile_friendly') else 'no'}",
+        f"Charset: {result.get('charset') or 'N/A'}",
+        _SEP,
+    ]
+    return "\n".join(lines) + "\n"
 
 
 def _format_full_report(result: Dict[str, Any]) -> str:
     if result.get("error"):
-        return (
-            "\n" + "=" * 60 + "\n"
-            + "WEB ANALYZER - FULL AUDIT\n"
-            + "=" * 60 + "\n"
-            + f"URL: {result.get('url')}\n"
-            + f"Timestamp: {result.get('timestamp')}\n"
-            + f"Error: {result.get('error')}\n"
-            + "=" * 60 + "\n"
-        )
+        return _format_error_report("WEB ANALYZER - FULL AUDIT", result)
 
     lines = [
         "",
-        "=" * 60,
+        _SEP,
         "WEB ANALYZER - FULL AUDIT",
-        "=" * 60,
+        _SEP,
         f"URL: {result.get('url')}",
         f"Final URL: {result.get('final_url')}",
         f"Timestamp: {result.get('timestamp')}",
         f"HTTP status: {result.get('status')}",
         f"Overall score: {result.get('overall_score')}/100",
-        "-" * 60,
+        _RULE,
         "Scores by criterion:",
     ]
 
@@ -702,38 +1286,89 @@ def _format_full_report(result: Dict[str, Any]) -> str:
         method = criteria.get(name, {}).get("method")
         lines.append(f"  - {name}: {score}/100 ({method})")
 
-    lines.append("=" * 60)
+    lines.append(_SEP)
     return "\n".join(lines) + "\n"
 
 
+def _dump_json(result: Dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+
 def format_report(result: Dict[str, Any], output_format: str = "text") -> str:
     """Render report text or JSON."""
     if output_format == "json":
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return _dump_json(result)
 
     if result.get("mode") == "full":
         return _format_full_report(result)
     return _format_basic_report(result)
 
 
+_RESULT_CACHE = TTLCache(maxsize=512, ttl=300)
+
+
+def analyze_url(
+    url: str,
+    full: bool = False,
+    timeout: int = 10,
+    use_cache: bool = True,
+    store: Optional[AuditStore] = None,
+) -> Dict[str, Any]:
+    """Run the basic check or the full audit for ``url`` without printing it.
+
+    Successful results of 2xx pages are kept for a few minutes, so repeating a URL in the
+    same session does not fetch and parse it again unless ``use_cache`` is off;
+    the fetch and parse are also shared when the same URL is checked in the
+    other mode. A ``store`` lets the fetch revalidate a page saved by an
+    earlier run and reuses parses of unchanged content. Safe to call from
+    several threads at once.
+    """
+    cache_key = (normalize_url(url), full, timeout)
+    result = _RESULT_CACHE.get(cache_key) if use_cache else None
+
+    if result is None:
+        result = _analyze(url, timeout, full=full, max_bytes=MAX_HTML_BYTES, store=store, memoize=use_cache)
+        if use_cache and is_cacheable_result(result):
+            _RESULT_CACHE.set(cache_key, result)
+    return result
+
+
 def verificar_url(
     url: str,
     full: bool = False,
     timeout: int = 10,
     output_format: str = "text",
     report_file: Optional[str] = None,
+    use_cache: bool = True,
+    store: Optional[AuditStore] = None,
+    output: Optional[TextIO] = None,
 ) -> Dict[str, Any]:
-    """Compatibility wrapper used by the CLI entry points."""
-    if full:
-        result = run_full_audit(url, timeout=timeout)
-    else:
-        result = run_basic_analysis(url, timeout=timeout)
+    """Compatibility wrapper used by the CLI entry points.
+
+    Runs :func:`analyze_url` and prints the report, optionally saving it too.
+    """
+    result = analyze_url(url, full=full, timeout=timeout, use_cache=use_cache, store=store)
+    emit_report(result, output_format=output_format, report_file=report_file, output=output)
+    return result
+
 
+def emit_report(
+    result: Dict[str, Any],
+    output_format: str = "text",
+    report_file: Optional[str] = None,
+    output: Optional[TextIO] = None,
+) -> None:
+    """Write a rendered result to ``output`` (stdout by default) and optionally
+    save it to ``report_file``.
+
+    The report goes out in a single ``write`` so concurrent callers sharing a
+    stream never interleave their lines.
+    """
     rendered = format_report(result, output_format=output_format)
-    print(rendered)
+    (output or sys.stdout).write(rendered + "\n")
 
     if report_file:
         with open(report_file, "w", encoding="utf-8") as handle:
-            handle.write(rendered if output_format == "text" else json.dumps(result, indent=2, ensure_ascii=False))
-
-    return result
+            handle.write(rendered)
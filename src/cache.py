@@ -0,0 +1,224 @@
+"""Caches used to avoid repeating fetches and parses across audits."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+DEFAULT_FETCH_TTL = 24 * 60 * 60
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory (honours XDG_CACHE_HOME)."""
+    base = os.getenv("XDG_CACHE_HOME", "").strip() or os.path.join(Path.home(), ".cache")
+    return Path(base) / "web-analyzer"
+
+
+def content_digest(text: str) -> str:
+    """Stable fingerprint of a page body, used to detect content changes."""
+    return hashlib.blake2b(text.encode("utf-8", "replace"), digest_size=16).hexdigest()
+
+
+class TTLCache:
+    """In-memory LRU cache whose entries expire after ``ttl`` seconds.
+
+    With ``maxweight`` set, entries are also evicted oldest first once the sum
+    of ``weigh(value)`` over the cache exceeds it, and a single value heavier
+    than the whole budget is not stored at all.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        ttl: float = 300.0,
+        maxweight: Optional[int] = None,
+        weigh: Optional[Callable[[Any], int]] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxweight = maxweight
+        self._weigh = weigh or (lambda _value: 0)
+        self._weight = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        # A single dict lookup is atomic, so misses skip the lock; hits still
+        # take it to check expiry and update recency.
+        if key not in self._data:
+            return default
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value, weight = entry
+            if expires_at <= now:
+                del self._data[key]
+                self._weight -= weight
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl
+        weight = self._weigh(value) if self.maxweight is not None else 0
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self._weight -= previous[2]
+            if self.maxweight is not None and weight > self.maxweight:
+                return
+            self._data[key] = (expires_at, value, weight)
+            self._weight += weight
+            while len(self._data) > self.maxsize or (
+                self.maxweight is not None and self._weight > self.maxweight
+            ):
+                self._weight -= self._data.popitem(last=False)[1][2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._weight = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class AuditStore:
+    """SQLite store of fetched pages and their parsed stats.
+
+    Page bodies are kept compressed with their validators (ETag and
+    Last-Modified) so they can be revalidated with a conditional GET for up to
+    ``fetch_ttl`` seconds. Parsed stats are keyed by URL and content digest.
+    """
+
+    def __init__(self, path: str, fetch_ttl: float = DEFAULT_FETCH_TTL) -> None:
+        self.path = path
+        self.fetch_ttl = fetch_ttl
+        # Shared by batch worker threads; every statement runs under the lock.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS page_stats ("
+            " url TEXT PRIMARY KEY,"
+            " content_hash TEXT NOT NULL,"
+            " stats_json TEXT NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fetched_pages ("
+            " url TEXT PRIMARY KEY,"
+            " final_url TEXT NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " encoding TEXT,"
+            " headers_json TEXT NOT NULL,"
+            " body_gz BLOB NOT NULL,"
+            " fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_page(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the stored page for ``url`` unless it is older than ``fetch_ttl``."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT final_url, etag, last_modified, encoding, headers_json, body_gz, fetched_at"
+                " FROM fetched_pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None or time.time() - row[6] > self.fetch_ttl:
+            return None
+        try:
+            body = zlib.decompress(row[5])
+        except zlib.error:
+            return None
+        return {
+            "final_url": row[0],
+            "etag": row[1],
+            "last_modified": row[2],
+            "encoding": row[3],
+            "headers": json.loads(row[4]),
+            "body": body,
+        }
+
+    def put_page(
+        self,
+        url: str,
+        final_url: str,
+        headers: Dict[str, str],
+        encoding: Optional[str],
+        body: bytes,
+    ) -> None:
+        row = (
+            url,
+            final_url,
+            headers.get("etag"),
+            headers.get("last-modified"),
+            encoding,
+            json.dumps(headers),
+            zlib.compress(body),
+            time.time(),
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fetched_pages"
+                " (url, final_url, etag, last_modified, encoding, headers_json, body_gz, fetched_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+            self._conn.commit()
+
+    def touch_page(self, url: str) -> None:
+        """Mark a stored page as freshly revalidated."""
+        with self._lock:
+            self._conn.execute("UPDATE fetched_pages SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+
+    def get(self, url: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stats_json FROM page_stats WHERE url = ? AND content_hash = ?",
+                (url, content_hash),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def put(self, url: str, content_hash: str, stats: Dict[str, Any]) -> None:
+        payload = json.dumps(stats)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO page_stats (url, content_hash, stats_json, updated_at)"
+                " VALUES (?, ?, ?, ?)",
+                (url, content_hash, payload, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_audit_store(
+    path: Optional[str] = None,
+    fetch_ttl: float = DEFAULT_FETCH_TTL,
+) -> Optional[AuditStore]:
+    """Open the persistent store, or return None if the cache is unusable."""
+    try:
+        if path is None:
+            cache_dir = default_cache_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            path = str(cache_dir / "cache.sqlite")
+        return AuditStore(path, fetch_ttl=fetch_ttl)
+    except (OSError, sqlite3.Error):
+        return None
@@ -0,0 +1,95 @@
+"""Minimal command-line parser for the common CLI invocations.
+
+It understands exactly the options declared by ``main.build_parser`` in their
+plain spellings (``-t 5``, ``--timeout 5``) and returns ``None`` for anything
+else, such as ``--timeout=5``, combined short flags, abbreviations or invalid
+values, so that argparse can handle it and report errors as usual.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .cache import DEFAULT_FETCH_TTL
+
+# The single source of the CLI defaults; ``main.build_parser`` reads its
+# option defaults from here, so both parsers always agree.
+DEFAULTS: Dict[str, Any] = {
+    "url": None,
+    "arquivo": None,
+    "full": False,
+    "timeout": 10,
+    "format": "text",
+    "json": False,
+    "report": None,
+    "workers": 16,
+    "use_async": False,
+    "concurrency": 200,
+    "cache": False,
+    "no_cache": False,
+    "cache_ttl": DEFAULT_FETCH_TTL,
+    "help": False,
+}
+
+_SWITCHES = {
+    "-F": "full",
+    "--full": "full",
+    "-j": "json",
+    "--json": "json",
+    "--async": "use_async",
+    "--cache": "cache",
+    "--no-cache": "no_cache",
+    "-h": "help",
+    "--help": "help",
+}
+
+
+def _output_format(value: str) -> str:
+    if value not in ("text", "json"):
+        raise ValueError(value)
+    return value
+
+
+_OPTIONS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "-f": ("arquivo", str),
+    "--arquivo": ("arquivo", str),
+    "-t": ("timeout", int),
+    "--timeout": ("timeout", int),
+    "-o": ("format", _output_format),
+    "--format": ("format", _output_format),
+    "-r": ("report", str),
+    "--report": ("report", str),
+    "-w": ("workers", int),
+    "--workers": ("workers", int),
+    "--concurrency": ("concurrency", int),
+    "--cache-ttl": ("cache_ttl", int),
+}
+
+
+def parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse ``argv`` like ``build_parser().parse_args``, or return None."""
+    values = dict(DEFAULTS)
+    index = 0
+    while index < len(argv):
+        token = argv[index]
+        index += 1
+        switch = _SWITCHES.get(token)
+        if switch is not None:
+            values[switch] = True
+            continue
+        option = _OPTIONS.get(token)
+        if option is not None:
+            if index >= len(argv) or argv[index].startswith("-"):
+                return None
+            dest, convert = option
+            try:
+                values[dest] = convert(argv[index])
+            except ValueError:
+                return None
+            index += 1
+            continue
+        if token.startswith("-") or values["url"] is not None:
+            return None
+        values["url"] = token
+    return SimpleNamespace(**values)
@@ -4,10 +4,13 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
+from functools import lru_cache
 from typing import List, Optional
 
-from .analyzer import verificar_url
+from . import fastargs
+from .cache import open_audit_store
 from .utils import (
     modo_arquivo,
     modo_interativo,
@@ -21,11 +24,11 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("url", nargs="?", help="URL to analyze")
     parser.add_argument("-f", "--arquivo", dest="arquivo", help="Path to file containing URLs")
     parser.add_argument("-F", "--full", action="store_true", help="Run complete quality audit")
-    parser.add_argument("-t", "--timeout", type=int, default=10, help="HTTP timeout in seconds")
+    parser.add_argument("-t", "--timeout", type=int, default=fastargs.DEFAULTS["timeout"], help="HTTP timeout in seconds")
     parser.add_argument(
         "-o",
         "--format",
-        default="text",
+        default=fastargs.DEFAULTS["format"],
         choices=["text", "json"],
         help="Output format",
     )
@@ -37,13 +40,61 @@ def build_parser() -> argparse.ArgumentParser:
             "Output file for single URL mode, or directory for batch/interative modes"
         ),
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=fastargs.DEFAULTS["workers"],
+        help="URLs checked at once in file mode",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Check file URLs with asyncio instead of a thread pool",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=fastargs.DEFAULTS["concurrency"],
+        help="Requests in flight with --async",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Keep fetched pages and parses in ~/.cache/web-analyzer/cache.sqlite across runs",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable result, fetch and parse caches")
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=fastargs.DEFAULTS["cache_ttl"],
+        help="Seconds a page stored with --cache is revalidated instead of downloaded again",
+    )
     parser.add_argument("-h", "--help", action="store_true", help="Show help")
     return parser
 
 
+@lru_cache(maxsize=None)
+def _get_parser() -> argparse.ArgumentParser:
+    """Shared parser for :func:`main`; ``build_parser`` still returns a fresh one."""
+    return build_parser()
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    """Try the small hand-rolled parser first; argparse handles everything else.
+
+    Set ``WEB_ANALYZER_ARGPARSE=1`` to always use argparse.
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    args = None if os.getenv("WEB_ANALYZER_ARGPARSE") else fastargs.parse(argv)
+    if args is None:
+        args = _get_parser().parse_args(argv)
+    return args
+
+
 def main(argv: Optional[List[str]] = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    args = _parse_args(argv)
 
     if args.help:
         mostrar_ajuda()
@@ -53,7 +104,20 @@ def main(argv: Optional[List[str]] = None) -> int:
         print("Error: --timeout must be greater than zero")
         return 1
 
+    if args.workers <= 0:
+        print("Error: --workers must be greater than zero")
+        return 1
+
+    if args.concurrency <= 0:
+        print("Error: --concurrency must be greater than zero")
+        return 1
+
+    if args.cache_ttl < 0:
+        print("Error: --cache-ttl must not be negative")
+        return 1
+
     output_format = "json" if args.json else args.format
+    use_store = args.cache and not args.no_cache
 
     if args.arquivo:
         modo_arquivo(
@@ -62,18 +126,33 @@ def main(argv: Optional[List[str]] = None) -> int:
             timeout=args.timeout,
             output_format=output_format,
             report=args.report,
+            workers=args.workers,
+            use_cache=not args.no_cache,
+            use_store=use_store,
+            cache_ttl=args.cache_ttl,
+            use_async=args.use_async,
+            concurrency=args.concurrency,
         )
         return 0
 
     if args.url:
+        from .analyzer import verificar_url
+
         report_file = resolve_report_for_single_url(args.report, args.url, output_format)
-        verificar_url(
-            args.url,
-            full=args.full,
-            timeout=args.timeout,
-            output_format=output_format,
-            report_file=report_file,
-        )
+        store = open_audit_store(fetch_ttl=args.cache_ttl) if use_store else None
+        try:
+            verificar_url(
+                args.url,
+                full=args.full,
+                timeout=args.timeout,
+                output_format=output_format,
+                report_file=report_file,
+                use_cache=not args.no_cache,
+                store=store,
+            )
+        finally:
+            if store is not None:
+                store.close()
         return 0
 
     modo_interativo(
@@ -81,6 +160,9 @@ def main(argv: Optional[List[str]] = None) -> int:
         timeout=args.timeout,
         output_format=output_format,
         report=args.report,
+        use_cache=not args.no_cache,
+        use_store=use_store,
+        cache_ttl=args.cache_ttl,
     )
     return 0
 
@@ -3,30 +3,134 @@
 from __future__ import annotations
 
 import ipaddress
+import os
+import re
 import socket
-from typing import List, Optional, Union
-from urllib.parse import urlparse
+import threading
+import time
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
-from .analyzer import normalize_url
+from .analyzer import normalize_url, parse_normalized_url
+from .cache import TTLCache
 
-BLOCKED_HOSTNAMES = {
+BLOCKED_HOSTNAMES = frozenset({
     "localhost",
     "localhost.localdomain",
     "metadata.google.internal",
     "metadata",
-}
+})
 
-BLOCKED_IPV4_STRINGS = {
+BLOCKED_IPV4_STRINGS = frozenset({
     "0.0.0.0",
     "127.0.0.1",
     "169.254.169.254",  # cloud metadata services
-}
+})
+
+
+# Every IPv4 range that is private, loopback, link-local, multicast, reserved
+# or unspecified.  192.0.0.0/24 is blocked whole; ipaddress marks only parts
+# of it private, and which parts depends on the Python version.
+BLOCKED_IPV4_NETWORKS = (
+    "0.0.0.0/8",
+    "10.0.0.0/8",
+    "127.0.0.0/8",
+    "169.254.0.0/16",
+    "172.16.0.0/12",
+    "192.0.0.0/24",
+    "192.0.2.0/24",
+    "192.168.0.0/16",
+    "198.18.0.0/15",
+    "198.51.100.0/24",
+    "203.0.113.0/24",
+    "224.0.0.0/4",
+    "240.0.0.0/4",
+)
+
+
+# Plain ``http(s)://host[:port]`` prefix of a normalized URL, with nowhere for
+# credentials, brackets or escapes to hide; everything else goes to urlparse.
+_SIMPLE_URL_RE = re.compile(r"https?://([A-Za-z0-9._-]+)(?::[0-9]*)?(?=[/?#]|$)")
 
 
 IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
 
 
+def _ipv4_ranges(networks: Tuple[str, ...]) -> List[Tuple[int, int]]:
+    ranges: List[Tuple[int, int]] = []
+    for network in sorted(ipaddress.IPv4Network(cidr) for cidr in networks):
+        low, high = int(network.network_address), int(network.broadcast_address)
+        if ranges and low <= ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], max(high, ranges[-1][1]))
+        else:
+            ranges.append((low, high))
+    return ranges
+
+
+_BLOCKED_IPV4_RANGES = _ipv4_ranges(BLOCKED_IPV4_NETWORKS)
+_BLOCKED_IPV4_STARTS = [low for low, _high in _BLOCKED_IPV4_RANGES]
+
+
+def _dns_ttl_from_env(default: float = 60.0) -> float:
+    raw = os.getenv("WEB_ANALYZER_DNS_TTL", "").strip()
+    if not raw:
+        return default
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return default
+
+
+_DNS_TTL = _dns_ttl_from_env()
+# Successful lookups only; a failure is retried on the next validation.
+_DNS_CACHE = TTLCache(maxsize=4096, ttl=_DNS_TTL)
+# Messages of recent rejections, by raw URL. Resolution failures are left out,
+# like failed lookups in _DNS_CACHE, so they are retried.
+_REJECTED = TTLCache(maxsize=4096, ttl=_DNS_TTL)
+_UNRESOLVED_HOST = "Could not resolve host"
+
+
+class _PendingLookup:
+    """A lookup in flight; other threads wait for its result instead of
+    issuing the same getaddrinfo call."""
+
+    __slots__ = ("done", "ips")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.ips: List[IPAddress] = []
+
+
+_DNS_PENDING: Dict[str, _PendingLookup] = {}
+_DNS_PENDING_LOCK = threading.Lock()
+
+
+def _is_blocked_ipv4_int(value: int) -> bool:
+    index = bisect_right(_BLOCKED_IPV4_STARTS, value) - 1
+    return index >= 0 and value <= _BLOCKED_IPV4_RANGES[index][1]
+
+
+def _ipv4_int(host: str) -> Optional[int]:
+    """Integer value of a strict dotted-quad ``host``, else ``None``."""
+    parts = host.split(".")
+    if len(parts) != 4:
+        return None
+    value = 0
+    for part in parts:
+        # Same rules as ipaddress: 1-3 ASCII decimal digits, no leading zeros.
+        if not (part.isascii() and part.isdigit()) or len(part) > 3 or (len(part) > 1 and part[0] == "0"):
+            return None
+        octet = int(part)
+        if octet > 255:
+            return None
+        value = (value << 8) | octet
+    return value
+
+
 def _is_blocked_ip(ip: IPAddress) -> bool:
+    if ip.version == 4:
+        return _is_blocked_ipv4_int(int(ip))
     return (
         ip.is_private
         or ip.is_loopback
@@ -38,6 +142,29 @@ def _is_blocked_ip(ip: IPAddress) -> bool:
 
 
 def _resolve_host_ips(hostname: str) -> List[IPAddress]:
+    cached = _DNS_CACHE.get(hostname)
+    if cached is not None:
+        return list(cached)
+
+    with _DNS_PENDING_LOCK:
+        pending = _DNS_PENDING.get(hostname)
+        owner = pending is None
+        if owner:
+            pending = _DNS_PENDING[hostname] = _PendingLookup()
+    if not owner:
+        pending.done.wait()
+        return list(pending.ips)
+
+    try:
+        pending.ips = _lookup_host_ips(hostname)
+        return list(pending.ips)
+    finally:
+        with _DNS_PENDING_LOCK:
+            del _DNS_PENDING[hostname]
+        pending.done.set()
+
+
+def _lookup_host_ips(hostname: str) -> List[IPAddress]:
     try:
         records = socket.getaddrinfo(hostname, None)
     except socket.gaierror:
@@ -52,6 +179,8 @@ def _resolve_host_ips(hostname: str) -> List[IPAddress]:
         except ValueError:
             continue
 
+    if ips:
+        _DNS_CACHE.set(hostname, tuple(ips))
     return ips
 
 
@@ -70,11 +199,21 @@ def _validate_host(hostname: str) -> None:
     if host in BLOCKED_IPV4_STRINGS:
         raise ValueError("Blocked host")
 
+    # IP literals start with a digit (IPv4) or contain ":" (IPv6); anything
+    # else is a DNS name and can skip the parse attempt.
+    if host[0].isdigit():
+        ipv4 = _ipv4_int(host)
+        if ipv4 is not None:
+            if _is_blocked_ipv4_int(ipv4):
+                raise ValueError("Private/internal IP addresses are not allowed")
+            return
+
     parsed_ip: Optional[IPAddress] = None
-    try:
-        parsed_ip = ipaddress.ip_address(host)
-    except ValueError:
-        parsed_ip = None
+    if host[0].isdigit() or ":" in host:
+        try:
+            parsed_ip = ipaddress.ip_address(host)
+        except ValueError:
+            parsed_ip = None
 
     if parsed_ip:
         if _is_blocked_ip(parsed_ip):
@@ -83,17 +222,22 @@ def _validate_host(hostname: str) -> None:
 
     resolved_ips = _resolve_host_ips(host)
     if not resolved_ips:
-        raise ValueError("Could not resolve host")
+        raise ValueError(_UNRESOLVED_HOST)
 
     for ip in resolved_ips:
         if _is_blocked_ip(ip):
             raise ValueError("Host resolves to private/internal IP")
 
 
-def validate_public_url(raw_url: str) -> str:
-    """Validate URL and ensure it targets a public web host."""
+@lru_cache(maxsize=4096)
+def _validate_public_url_cached(raw_url: str, _ttl_bucket: int) -> str:
     url = normalize_url(raw_url)
-    parsed = urlparse(url)
+    simple = _SIMPLE_URL_RE.match(url)
+    if simple:
+        _validate_host(simple.group(1))
+        return url
+
+    url, parsed = parse_normalized_url(raw_url)
 
     if parsed.scheme not in {"http", "https"}:
         raise ValueError("Only http and https URLs are allowed")
@@ -106,3 +250,32 @@ def validate_public_url(raw_url: str) -> str:
 
     _validate_host(parsed.hostname)
     return url
+
+
+def validate_public_url(raw_url: str) -> str:
+    """Validate URL and ensure it targets a public web host.
+
+    Results are memoized for the DNS cache TTL (``WEB_ANALYZER_DNS_TTL``), so a
+    host that starts resolving to a private address is caught at most one TTL
+    later. Rejections are remembered for the same TTL, except for hosts that
+    did not resolve, which are retried on the next call.
+    """
+    if _DNS_TTL <= 0:
+        return _validate_public_url_cached.__wrapped__(raw_url, 0)
+    rejected = _REJECTED.get(raw_url)
+    if rejected is not None:
+        raise ValueError(rejected)
+    try:
+        return _validate_public_url_cached(raw_url, int(time.monotonic() // _DNS_TTL))
+    except ValueError as exc:
+        message = str(exc)
+        if message != _UNRESOLVED_HOST:
+            _REJECTED.set(raw_url, message)
+        raise
+
+
+def clear_caches() -> None:
+    """Forget memoized DNS lookups, validated URLs and rejections."""
+    _DNS_CACHE.clear()
+    _REJECTED.clear()
+    _validate_public_url_cached.cache_clear()
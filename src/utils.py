@@ -2,23 +2,72 @@
 
 from __future__ import annotations
 
+import io
+import os
 import re
-from datetime import datetime, timezone
-from pathlib import Path
-from typing import Optional
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, Optional
 
-from .analyzer import normalize_url, verificar_url
+from .cache import DEFAULT_FETCH_TTL, open_audit_store
+
+# The analyzer modules (requests, httpx, bs4, asyncio) are imported inside the
+# functions that need them, so ``--help`` and argument errors return without
+# loading them.
+
+
+_NON_SLUG_RE = re.compile(r"[^a-z0-9._-]")
+_DASHES_RE = re.compile(r"-+")
+
+# (second, formatted UTC timestamp) of the last report path built.
+_TIMESTAMP_CACHE = (-1, "")
 
 
 def _slugify_url(url: str) -> str:
-    normalized = normalize_url(url)
-    cleaned = re.sub(r"^https?://", "", normalized, flags=re.IGNORECASE)
+    from .analyzer import parse_normalized_url
+
+    normalized, _parsed = parse_normalized_url(url)
+    # Normalized URLs always start with http:// or https://.
+    cleaned = normalized.partition("://")[2]
     cleaned = cleaned.strip().lower().replace("/", "-")
-    cleaned = re.sub(r"[^a-z0-9._-]", "-", cleaned)
-    cleaned = re.sub(r"-+", "-", cleaned).strip("-")
+    cleaned = _NON_SLUG_RE.sub("-", cleaned)
+    cleaned = _DASHES_RE.sub("-", cleaned).strip("-")
     return cleaned or "report"
 
 
+def _report_ext(output_format: str) -> str:
+    return "json" if output_format == "json" else "txt"
+
+
+def _prepare_report_dir(report: Optional[str]) -> Optional[str]:
+    """Create the report directory once, before a multi-URL run."""
+    if not report:
+        return None
+    os.makedirs(report, exist_ok=True)
+    return report
+
+
+def _utc_timestamp() -> str:
+    """``YYYYmmdd-HHMMSS`` for now, formatted at most once per second."""
+    global _TIMESTAMP_CACHE
+    second = int(time.time())
+    cached_second, cached = _TIMESTAMP_CACHE
+    if second != cached_second:
+        cached = time.strftime("%Y%m%d-%H%M%S", time.gmtime(second))
+        # A single tuple assignment, so readers never see a torn pair.
+        _TIMESTAMP_CACHE = (second, cached)
+    return cached
+
+
+def _report_path_for(base: Optional[str], url: str, output_format: str) -> Optional[str]:
+    """Timestamped report file for ``url`` inside an already created ``base``."""
+    if base is None:
+        return None
+    filename = f"{_slugify_url(url)}-{_utc_timestamp()}.{_report_ext(output_format)}"
+    return os.path.join(base, filename)
+
+
 def _resolve_report_path(
     report: Optional[str],
     url: str,
@@ -28,18 +77,15 @@ def _resolve_report_path(
     if not report:
         return None
 
-    ext = "json" if output_format == "json" else "txt"
-    base = Path(report)
-
-    if single_mode and (base.suffix or not base.exists()):
-        if not base.suffix:
-            base = base.with_suffix(f".{ext}")
-        return str(base)
+    if single_mode:
+        path = report.rstrip("/" + os.sep)
+        # A lone trailing dot is not a suffix, as with ``Path.suffix``.
+        if len(os.path.splitext(path)[1]) > 1:
+            return path
+        if not os.path.exists(report):
+            return f"{path}.{_report_ext(output_format)}"
 
-    base.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-    filename = f"{_slugify_url(url)}-{timestamp}.{ext}"
-    return str(base / filename)
+    return _report_path_for(_prepare_report_dir(report), url, output_format)
 
 
 def modo_interativo(
@@ -47,8 +93,17 @@ def modo_interativo(
     timeout: int = 10,
     output_format: str = "text",
     report: Optional[str] = None,
+    use_cache: bool = True,
+    use_store: bool = False,
+    cache_ttl: float = DEFAULT_FETCH_TTL,
 ):
-    """Interactive mode to test multiple URLs."""
+    """Interactive mode to test multiple URLs.
+
+    With ``use_store``, pages are also kept in the on-disk store (see
+    :func:`modo_arquivo`).
+    """
+    from .analyzer import verificar_url
+
     print(
         "\n"
         "WEB ANALYZER CLI\n"
@@ -57,24 +112,41 @@ def modo_interativo(
         "Type 'sair' to exit.\n"
     )
 
-    while True:
-        url = input("URL: ").strip()
+    report_dir = _prepare_report_dir(report)
+    store = open_audit_store(fetch_ttl=cache_ttl) if use_store else None
+    try:
+        while True:
+            url = input("URL: ").strip()
 
-        if url.lower() in ["sair", "exit", "quit"]:
-            print("\nBye!")
-            break
+            if url.lower() in ["sair", "exit", "quit"]:
+                print("\nBye!")
+                break
+
+            if not url:
+                continue
+
+            report_file = _report_path_for(report_dir, url, output_format)
+            verificar_url(
+                url,
+                full=full,
+                timeout=timeout,
+                output_format=output_format,
+                report_file=report_file,
+                use_cache=use_cache,
+                store=store,
+            )
+    finally:
+        if store is not None:
+            store.close()
 
-        if not url:
-            continue
 
-        report_file = _resolve_report_path(report, url, output_format, single_mode=False)
-        verificar_url(
-            url,
-            full=full,
-            timeout=timeout,
-            output_format=output_format,
-            report_file=report_file,
-        )
+def _iter_urls(path: str) -> Iterator[str]:
+    """Yield the stripped, non-empty lines of ``path`` as they are read."""
+    with open(path, "r", encoding="utf-8") as file_handle:
+        for line in file_handle:
+            url = line.strip()
+            if url:
+                yield url
 
 
 def modo_arquivo(
@@ -83,63 +155,122 @@ def modo_arquivo(
     timeout: int = 10,
     output_format: str = "text",
     report: Optional[str] = None,
+    workers: int = 16,
+    use_cache: bool = True,
+    use_store: bool = False,
+    cache_ttl: float = DEFAULT_FETCH_TTL,
+    use_async: bool = False,
+    concurrency: int = 200,
 ):
-    """Read URLs from a file and execute checks."""
+    """Read URLs from a file and check up to ``workers`` of them at a time.
+
+    Reports are printed as each URL finishes, so they follow completion order
+    rather than file order. With ``use_async``, URLs are fetched as coroutines
+    instead, up to ``concurrency`` at once, and reports follow file order.
+    With ``use_store``, fetched and parsed pages are kept in a SQLite store
+    under the user cache directory, so a re-run revalidates pages instead of
+    downloading them again and only parses pages whose content changed.
+    """
+    from .analyzer import emit_report
+
+    store = open_audit_store(fetch_ttl=cache_ttl) if use_store else None
     try:
-        with open(arquivo, "r", encoding="utf-8") as file_handle:
-            urls = [line.strip() for line in file_handle if line.strip()]
+        report_dir = _prepare_report_dir(report)
+        if use_async:
+            import asyncio
 
-        print(f"Loaded {len(urls)} URLs from {arquivo}")
+            from .utils_async import run_batch
 
-        for url in urls:
-            report_file = _resolve_report_path(report, url, output_format, single_mode=False)
-            verificar_url(
-                url,
-                full=full,
-                timeout=timeout,
-                output_format=output_format,
-                report_file=report_file,
+            urls = list(_iter_urls(arquivo))
+            print(f"Loaded {len(urls)} URLs from {arquivo}")
+            results = asyncio.run(
+                run_batch(urls, concurrency=concurrency, full=full, timeout=timeout, store=store)
             )
+            # Every report is ready at once, so they go out in one write.
+            buffer = io.StringIO()
+            for url, result in zip(urls, results):
+                report_file = _report_path_for(report_dir, url, output_format)
+                emit_report(result, output_format=output_format, report_file=report_file, output=buffer)
+            sys.stdout.write(buffer.getvalue())
+            return
+
+        from .analyzer import analyze_url
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Work starts as soon as the first line is read.
+            futures: Dict["Future[Dict[str, Any]]", str] = {}
+            for url in _iter_urls(arquivo):
+                future = executor.submit(
+                    analyze_url, url, full=full, timeout=timeout, use_cache=use_cache, store=store
+                )
+                futures[future] = url
+            print(f"Loaded {len(futures)} URLs from {arquivo}")
+
+            # Reports are emitted from this thread only, so they never interleave.
+            for future in as_completed(futures):
+                url = futures[future]
+                report_file = _report_path_for(report_dir, url, output_format)
+                emit_report(future.result(), output_format=output_format, report_file=report_file)
 
     except FileNotFoundError:
         print(f"Error: file '{arquivo}' not found")
     except Exception as exc:  # pragma: no cover
         print(f"Error: {exc}")
+    finally:
+        if store is not None:
+            store.close()
+
+
+_HELP_TEXT = (
+    b"\n"
+    b"WEB ANALYZER CLI - usage\n"
+    b"\n"
+    b"Comandos curtos (apos instalar como pacote):\n"
+    b"  wa <url>                 -> modo normal\n"
+    b"  waf <url>                -> full audit\n"
+    b"  wab urls.txt             -> lote (full audit)\n"
+    b"\n"
+    b"Basic check:\n"
+    b"  web-analyzer <url>\n"
+    b"  wa <url>\n"
+    b"\n"
+    b"Full audit (scores for performance/security/seo/accessibility/best-practices):\n"
+    b"  web-analyzer <url> --full\n"
+    b"  waf <url>\n"
+    b"\n"
+    b"Read URLs from file:\n"
+    b"  web-analyzer --arquivo urls.txt [--full]\n"
+    b"  wab urls.txt\n"
+    b"\n"
+    b"Output format and report file/directory:\n"
+    b"  waf <url> -j -r report.json\n"
+    b"  wab urls.txt -j -r ./reports\n"
+    b"\n"
+    b"Flags:\n"
+    b"  -t, --timeout <seconds>      request timeout (default: 10)\n"
+    b"  -o, --format text|json       output format (default: text)\n"
+    b"  -j, --json                   shortcut for --format json\n"
+    b"  -r, --report                 output file/folder for report(s)\n"
+    b"  --cache                      keep pages in ~/.cache/web-analyzer/cache.sqlite\n"
+    b"  --no-cache                   always fetch and parse again\n"
+    b"  --cache-ttl <seconds>        revalidate pages stored with --cache this long (default: 86400)\n"
+    b"  -w, --workers <n>            URLs checked at once in file mode (default: 16)\n"
+    b"  --async                      file mode with asyncio instead of threads\n"
+    b"  --concurrency <n>            requests in flight with --async (default: 200)\n"
+    b"\n"
+)
 
 
 def mostrar_ajuda():
     """Print help text with examples."""
-    print(
-        "\n"
-        "WEB ANALYZER CLI - usage\n"
-        "\n"
-        "Comandos curtos (apos instalar como pacote):\n"
-        "  wa <url>                 -> modo normal\n"
-        "  waf <url>                -> full audit\n"
-        "  wab urls.txt             -> lote (full audit)\n"
-        "\n"
-        "Basic check:\n"
-        "  web-analyzer <url>\n"
-        "  wa <url>\n"
-        "\n"
-        "Full audit (scores for performance/security/seo/accessibility/best-practices):\n"
-        "  web-analyzer <url> --full\n"
-        "  waf <url>\n"
-        "\n"
-        "Read URLs from file:\n"
-        "  web-analyzer --arquivo urls.txt [--full]\n"
-        "  wab urls.txt\n"
-        "\n"
-        "Output format and report file/directory:\n"
-        "  waf <url> -j -r report.json\n"
-        "  wab urls.txt -j -r ./reports\n"
-        "\n"
-        "Flags:\n"
-        "  -t, --timeout <seconds>      request timeout (default: 10)\n"
-        "  -o, --format text|json       output format (default: text)\n"
-        "  -j, --json                   shortcut for --format json\n"
-        "  -r, --report                 output file/folder for report(s)\n"
-    )
+    try:
+        stream = sys.stdout.buffer
+    except AttributeError:  # redirected to a text-only stream
+        sys.stdout.write(_HELP_TEXT.decode("ascii"))
+        return
+    sys.stdout.flush()
+    stream.write(_HELP_TEXT)
+    stream.flush()
 
 
 def resolve_report_for_single_url(report: Optional[str], url: str, output_format: str) -> Optional[str]:
@@ -0,0 +1,23 @@
+"""Asyncio batch driver for file mode (``--async``)."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from .analyzer import run_batch_async
+from .cache import AuditStore
+
+
+async def run_batch(
+    urls: List[str],
+    concurrency: int = 200,
+    full: bool = False,
+    timeout: int = 10,
+    store: Optional[AuditStore] = None,
+) -> List[Dict[str, Any]]:
+    """Check ``urls`` as coroutines, at most ``concurrency`` fetches in flight.
+
+    All requests go through one pooled async HTTP client, so connections are
+    reused across URLs of the same host. Results keep the order of ``urls``.
+    """
+    return await run_batch_async(urls, full=full, timeout=timeout, concurrency=concurrency, store=store)
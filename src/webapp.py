@@ -2,25 +2,48 @@
 
 from __future__ import annotations
 
+import asyncio
+import gzip
+import hashlib
+import hmac
+import json
+import math
 import os
 import threading
 import time
-from collections import defaultdict, deque
-from typing import Any, Deque, Dict, Literal, Set, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
+from typing import Any, AsyncIterator, Dict, FrozenSet, Hashable, List, Literal, Optional, Tuple
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from pydantic import BaseModel, Field
 
-from .analyzer import run_basic_analysis, run_full_audit
-from .url_safety import validate_public_url
+from .analyzer import close_http_session, is_cacheable_result, run_basic_analysis, run_full_audit
+from .cache import TTLCache
+from .url_safety import clear_caches as _clear_url_caches, validate_public_url
+
+try:  # Optional, installed with the "fast" extra.
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+try:  # Optional, installed with the "fast" extra.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 APP_TITLE = "Web Analyzer API"
 APP_VERSION = "2.4.0"
 
 
+@lru_cache(maxsize=None)
 def _int_env(name: str, default: int, minimum: int = 1) -> int:
+    """Integer setting from the environment, read once per process (see
+    :func:`reset_runtime_state`)."""
     raw = os.getenv(name, "").strip()
     if not raw:
         return default
@@ -31,7 +54,11 @@ def _int_env(name: str, default: int, minimum: int = 1) -> int:
     return max(minimum, value)
 
 
-def _load_api_keys() -> Set[str]:
+_API_KEYS: Optional[FrozenSet[str]] = None
+_API_KEYS_LOCK = threading.Lock()
+
+
+def _parse_api_keys() -> FrozenSet[str]:
     values = []
     single = os.getenv("WEB_ANALYZER_API_KEY", "")
     multi = os.getenv("WEB_ANALYZER_API_KEYS", "")
@@ -39,47 +66,109 @@ def _load_api_keys() -> Set[str]:
         values.extend(single.split(","))
     if multi:
         values.extend(multi.split(","))
-    return {item.strip() for item in values if item.strip()}
+    return frozenset(item.strip() for item in values if item.strip())
 
 
-def _client_ip(request: Request) -> str:
-    forwarded = request.headers.get("x-forwarded-for", "").strip()
-    if forwarded:
-        return forwarded.split(",")[0].strip()
-    if request.client and request.client.host:
-        return request.client.host
-    return "unknown"
+def _load_api_keys() -> FrozenSet[str]:
+    """Configured API keys, read from the environment on first use."""
+    global _API_KEYS
+    keys = _API_KEYS
+    if keys is None:
+        with _API_KEYS_LOCK:
+            keys = _API_KEYS
+            if keys is None:
+                keys = _API_KEYS = _parse_api_keys()
+    return keys
 
 
-class FixedWindowRateLimiter:
-    """In-memory fixed-window limiter (per instance)."""
+def _api_keys_configured() -> bool:
+    return bool(_load_api_keys())
 
-    def __init__(self) -> None:
-        self._hits: Dict[str, Deque[float]] = defaultdict(deque)
-        self._lock = threading.Lock()
 
-    def allow(self, identity: str, max_requests: int, window_seconds: int) -> Tuple[bool, int]:
-        now = time.time()
-        cutoff = now - window_seconds
+def _api_key_matches(provided: str, valid_keys: FrozenSet[str]) -> bool:
+    """Compare in constant time; large key sets fall back to a set lookup."""
+    if len(valid_keys) > 32:
+        return provided in valid_keys
+    candidate = provided.encode("utf-8")
+    # No short-circuit, so the time taken does not reveal which key matched.
+    matched = False
+    for key in valid_keys:
+        matched |= hmac.compare_digest(candidate, key.encode("utf-8"))
+    return matched
 
-        with self._lock:
-            bucket = self._hits[identity]
-            while bucket and bucket[0] <= cutoff:
-                bucket.popleft()
 
-            if len(bucket) >= max_requests:
-                retry_after = max(1, int(window_seconds - (now - bucket[0])))
-                return False, retry_after
+def _invalidate_api_keys() -> None:
+    global _API_KEYS
+    with _API_KEYS_LOCK:
+        _API_KEYS = None
 
-            bucket.append(now)
+
+def _client_ip(request: Request) -> str:
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        first = forwarded.partition(",")[0].strip()
+        if first:
+            return first
+    if request.client and request.client.host:
+        return request.client.host
+    return "unknown"
+
+
+RATE_LIMIT_SHARDS = 16
+MAX_TRACKED_IDENTITIES = 50_000
+
+
+class TokenBucketRateLimiter:
+    """In-memory token-bucket limiter (per instance).
+
+    Each identity holds up to ``max_requests`` tokens, refilled evenly over
+    ``window_seconds``, so bursts never exceed the limit across a window edge.
+    At most ``max_identities`` buckets are kept; the least recently seen
+    identity is forgotten first (and starts again with a full bucket).
+    """
+
+    def __init__(self, shards: int = RATE_LIMIT_SHARDS, max_identities: int = MAX_TRACKED_IDENTITIES) -> None:
+        # Identities are spread over independently locked shards, so requests
+        # from unrelated clients do not wait on each other.
+        self._shards: List[Tuple["OrderedDict[Hashable, Tuple[float, float]]", threading.Lock]] = [
+            (OrderedDict(), threading.Lock()) for _ in range(shards)
+        ]
+        self._shard_capacity = max(1, max_identities // shards)
+
+    def allow(
+        self,
+        identity: Hashable,
+        max_requests: int,
+        window_seconds: int,
+        now: Optional[float] = None,
+    ) -> Tuple[bool, int]:
+        """Spend one token for ``identity``; ``now`` is a ``time.monotonic()`` reading."""
+        if now is None:
+            now = time.monotonic()
+        rate = max_requests / window_seconds
+        buckets, lock = self._shards[hash(identity) % len(self._shards)]
+
+        with lock:
+            tokens, last = buckets.get(identity, (float(max_requests), now))
+            tokens = min(float(max_requests), tokens + (now - last) * rate)
+
+            allowed = tokens >= 1
+            buckets[identity] = (tokens - 1 if allowed else tokens, now)
+            buckets.move_to_end(identity)
+            if len(buckets) > self._shard_capacity:
+                buckets.popitem(last=False)
+
+            if not allowed:
+                return False, max(1, math.ceil((1 - tokens) / rate))
             return True, 0
 
     def clear(self) -> None:
-        with self._lock:
-            self._hits.clear()
+        for buckets, lock in self._shards:
+            with lock:
+                buckets.clear()
 
 
-RATE_LIMITER = FixedWindowRateLimiter()
+RATE_LIMITER = TokenBucketRateLimiter()
 
 
 def _require_api_key(request: Request) -> str:
@@ -94,18 +183,20 @@ def _require_api_key(request: Request) -> str:
     if not provided:
         raise HTTPException(status_code=401, detail="Missing x-api-key header")
 
-    if provided not in valid_keys:
+    if not _api_key_matches(provided, valid_keys):
         raise HTTPException(status_code=401, detail="Invalid API key")
 
     return provided
 
 
-def _apply_rate_limit(request: Request, api_key: str) -> None:
+def _apply_rate_limit(request: Request, api_key: str, now: Optional[float] = None) -> None:
     max_requests = _int_env("WEB_ANALYZER_RATE_LIMIT_REQUESTS", 20, minimum=1)
     window_seconds = _int_env("WEB_ANALYZER_RATE_LIMIT_WINDOW_SECONDS", 60, minimum=1)
 
-    identity = f"{api_key}:{_client_ip(request)}"
-    allowed, retry_after = RATE_LIMITER.allow(identity, max_requests=max_requests, window_seconds=window_seconds)
+    identity = (api_key, _client_ip(request))
+    allowed, retry_after = RATE_LIMITER.allow(
+        identity, max_requests=max_requests, window_seconds=window_seconds, now=now
+    )
 
     if not allowed:
         raise HTTPException(
@@ -115,19 +206,102 @@ def _apply_rate_limit(request: Request, api_key: str) -> None:
         )
 
 
+# Analyses run on their own bounded pool, sized by WEB_ANALYZER_MAX_WORKERS,
+# instead of competing with every other request for the server threadpool.
+_DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared analysis pool, starting it on first use."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=_int_env("WEB_ANALYZER_MAX_WORKERS", _DEFAULT_MAX_WORKERS, minimum=1),
+                    thread_name_prefix="web-analyzer",
+                )
+    return _EXECUTOR
+
+
+# Successful results per (url, mode, timeout), kept for
+# WEB_ANALYZER_RESULT_CACHE_SECONDS (0 disables) and capped at
+# WEB_ANALYZER_RESULT_CACHE_MAX entries.
+_RESULT_CACHE: Optional[TTLCache] = None
+_RESULT_CACHE_LOCK = threading.Lock()
+# Analyses in flight; identical concurrent requests await the same future.
+_INFLIGHT: "Dict[Tuple[str, str, int], asyncio.Future[Dict[str, Any]]]" = {}
+
+
+def _get_result_cache() -> Optional[TTLCache]:
+    global _RESULT_CACHE
+    ttl = _int_env("WEB_ANALYZER_RESULT_CACHE_SECONDS", 60, minimum=0)
+    if ttl == 0:
+        return None
+    if _RESULT_CACHE is None:
+        with _RESULT_CACHE_LOCK:
+            if _RESULT_CACHE is None:
+                _RESULT_CACHE = TTLCache(
+                    maxsize=_int_env("WEB_ANALYZER_RESULT_CACHE_MAX", 512, minimum=1),
+                    ttl=ttl,
+                )
+    return _RESULT_CACHE
+
+
+def _settle_analysis(
+    key: Tuple[str, str, int],
+    cache: Optional[TTLCache],
+    future: "asyncio.Future[Dict[str, Any]]",
+) -> None:
+    """Done-callback of a shared analysis: retire it and cache a good result.
+
+    It runs however the callers fared, so a first caller that disconnects does
+    not free the key while the analysis is still running.
+    """
+    if _INFLIGHT.get(key) is future:
+        del _INFLIGHT[key]
+    if cache is None or future.cancelled() or future.exception() is not None:
+        return
+    result = future.result()
+    if is_cacheable_result(result):
+        cache.set(key, result)
+
+
+async def _run_analysis(safe_url: str, mode: str, timeout: int) -> Dict[str, Any]:
+    """Run (or join, or reuse) the analysis of ``safe_url`` on the analysis pool."""
+    key = (safe_url, mode, timeout)
+    cache = _get_result_cache()
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    loop = asyncio.get_running_loop()
+    pending = _INFLIGHT.get(key)
+    if pending is not None and pending.get_loop() is loop:
+        return await asyncio.shield(pending)
+
+    runner = run_basic_analysis if mode == "basic" else run_full_audit
+    future = loop.run_in_executor(_get_executor(), partial(runner, safe_url, timeout=timeout))
+    _INFLIGHT[key] = future
+    future.add_done_callback(partial(_settle_analysis, key, cache))
+    # Shielded, so a client disconnecting does not cancel it for the others.
+    return await asyncio.shield(future)
+
+
 def reset_runtime_state() -> None:
     """Test helper to clear in-memory runtime state."""
+    global _RESULT_CACHE
     RATE_LIMITER.clear()
+    _invalidate_api_keys()
+    _int_env.cache_clear()
+    _RESULT_CACHE = None
+    _clear_url_caches()
 
 
-INDEX_HTML = """
-<!doctype html>
-<html lang="en">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>Web Analyzer</title>
-  <style>
+APP_CSS = """
     :root {
       --bg: #f4f7fb;
       --surface: #ffffff;
@@ -189,8 +363,7 @@ INDEX_HTML = """
     }
     input[type="text"],
     input[type="number"],
-    select,
-    textarea {
+    select {
       width: 100%;
       border: 1px solid var(--line);
       background: #fff;
@@ -201,8 +374,7 @@ INDEX_HTML = """
       outline: none;
     }
     input:focus,
-    select:focus,
-    textarea:focus {
+    select:focus {
       border-color: var(--brand);
       box-shadow: 0 0 0 3px rgba(15, 118, 110, 0.12);
     }
@@ -265,13 +437,20 @@ INDEX_HTML = """
       font-weight: 800;
     }
     .raw {
-      width: 100%;
+      margin: 0;
+      max-height: 520px;
       min-height: 260px;
+      overflow: auto;
+      border: 1px solid var(--line);
+      background: #fff;
+      color: var(--text);
+      border-radius: 10px;
+      padding: 11px 12px;
       font-family: ui-monospace, SFMono-Regular, Menlo, Consolas, monospace;
       font-size: 12px;
       line-height: 1.45;
-      white-space: pre;
-      resize: vertical;
+      white-space: pre-wrap;
+      word-break: break-word;
     }
     .badge {
       display: inline-block;
@@ -284,59 +463,10 @@ INDEX_HTML = """
     .badge.good { background: #e8f7ef; color: var(--ok); }
     .badge.mid { background: #fff7e8; color: var(--warn); }
     .badge.bad { background: #fdecec; color: var(--bad); }
-  </style>
-</head>
-<body>
-  <main class="wrap">
-    <section class="hero">
-      <h1>Web Analyzer</h1>
-      <p>Local quality audit for performance, security, SEO and accessibility.</p>
-    </section>
-
-    <section class="panel">
-      <form id="analyze-form">
-        <div class="row two">
-          <div>
-            <label for="api_key">API key (x-api-key)</label>
-            <input id="api_key" name="api_key" type="text" placeholder="Your API key" required />
-          </div>
-          <div>
-            <label for="url">Target URL</label>
-            <input id="url" name="url" type="text" placeholder="https://example.com" required />
-          </div>
-        </div>
-
-        <div class="row two">
-          <div>
-            <label for="mode">Mode</label>
-            <select id="mode" name="mode">
-              <option value="full">Full audit</option>
-              <option value="basic">Basic check</option>
-            </select>
-          </div>
-          <div>
-            <label for="timeout">Timeout (seconds)</label>
-            <input id="timeout" name="timeout" type="number" min="2" max="60" value="10" />
-          </div>
-        </div>
-
-        <div style="display:flex;justify-content:flex-end">
-          <button id="submit-btn" type="submit">Analyze</button>
-        </div>
-      </form>
-
-      <div id="status" class="status"></div>
+"""
 
-      <section id="result" class="result">
-        <div id="overall" class="overall"></div>
-        <div id="scores" class="score-grid"></div>
-        <label for="raw">JSON output</label>
-        <textarea id="raw" class="raw" readonly></textarea>
-      </section>
-    </section>
-  </main>
 
-  <script>
+APP_JS = """
     const form = document.getElementById('analyze-form');
     const submitBtn = document.getElementById('submit-btn');
     const statusEl = document.getElementById('status');
@@ -344,12 +474,22 @@ INDEX_HTML = """
     const overallEl = document.getElementById('overall');
     const scoresEl = document.getElementById('scores');
     const rawEl = document.getElementById('raw');
+    const apiKeyEl = document.getElementById('api_key');
+    const urlEl = document.getElementById('url');
+    const modeEl = document.getElementById('mode');
+    const timeoutEl = document.getElementById('timeout');
+
+    const CRITERIA_ORDER = ['performance', 'security', 'seo', 'accessibility', 'best_practices'];
+    // Indexed by how many of the 50/70/85 thresholds the score reaches.
+    const BADGES = [
+      '<span class="badge bad">critical</span>',
+      '<span class="badge mid">needs work</span>',
+      '<span class="badge good">good</span>',
+      '<span class="badge good">excellent</span>',
+    ];
 
     function badge(score) {
-      if (score >= 85) return '<span class="badge good">excellent</span>';
-      if (score >= 70) return '<span class="badge good">good</span>';
-      if (score >= 50) return '<span class="badge mid">needs work</span>';
-      return '<span class="badge bad">critical</span>';
+      return BADGES[(score >= 50) + (score >= 70) + (score >= 85)];
     }
 
     function renderResult(result, mode) {
@@ -359,10 +499,9 @@ INDEX_HTML = """
         overallEl.innerHTML = `Basic check completed (status ${result.status || 'N/A'})`;
       }
 
-      scoresEl.innerHTML = '';
+      const frag = document.createDocumentFragment();
       if (result.criteria) {
-        const order = ['performance', 'security', 'seo', 'accessibility', 'best_practices'];
-        for (const key of order) {
+        for (const key of CRITERIA_ORDER) {
           const item = result.criteria[key];
           if (!item) continue;
           const card = document.createElement('article');
@@ -372,22 +511,23 @@ INDEX_HTML = """
             <div class="value">${item.score}/100</div>
             <div style="font-size:12px;color:#587084">${item.method}</div>
           `;
-          scoresEl.appendChild(card);
+          frag.appendChild(card);
         }
       }
+      scoresEl.replaceChildren(frag);
 
-      rawEl.value = JSON.stringify(result, null, 2);
+      rawEl.textContent = JSON.stringify(result, null, 2);
       resultEl.style.display = 'block';
     }
 
     form.addEventListener('submit', async (event) => {
       event.preventDefault();
 
-      const apiKey = document.getElementById('api_key').value.trim();
+      const apiKey = apiKeyEl.value.trim();
       const payload = {
-        url: document.getElementById('url').value,
-        mode: document.getElementById('mode').value,
-        timeout: Number(document.getElementById('timeout').value || 10),
+        url: urlEl.value,
+        mode: modeEl.value,
+        timeout: Number(timeoutEl.value || 10),
       };
 
       submitBtn.disabled = true;
@@ -416,10 +556,108 @@ INDEX_HTML = """
         submitBtn.disabled = false;
       }
     });
-  </script>
+"""
+
+
+class _StaticAsset:
+    """A static payload encoded, compressed and fingerprinted once at import."""
+
+    __slots__ = ("body", "body_gzip", "body_br", "etag", "media_type", "headers", "gzip_headers", "br_headers")
+
+    def __init__(self, text: str, media_type: str, cache_control: str) -> None:
+        self.body = text.encode("utf-8")
+        # Compressed once, so the slowest (smallest) settings cost nothing per request.
+        self.body_gzip = gzip.compress(self.body, 9)
+        self.body_br = brotli.compress(self.body, quality=11) if brotli is not None else None
+        self.etag = hashlib.blake2b(self.body, digest_size=8).hexdigest()
+        self.media_type = media_type
+        self.headers = {
+            "Cache-Control": cache_control,
+            "ETag": f'"{self.etag}"',
+            "Vary": "Accept-Encoding",
+        }
+        # Each encoding is a different representation, so it gets its own tag.
+        self.gzip_headers = {**self.headers, "ETag": f'"{self.etag}-gzip"', "Content-Encoding": "gzip"}
+        self.br_headers = {**self.headers, "ETag": f'"{self.etag}-br"', "Content-Encoding": "br"}
+
+
+# Asset URLs carry the content hash, so browsers may keep them indefinitely.
+_IMMUTABLE = "public, max-age=86400, immutable"
+APP_CSS_ASSET = _StaticAsset(APP_CSS, "text/css", _IMMUTABLE)
+APP_JS_ASSET = _StaticAsset(APP_JS, "application/javascript", _IMMUTABLE)
+
+INDEX_HTML = (
+    """
+<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>Web Analyzer</title>
+  <link rel="stylesheet" href="/static/app.css?v="""
+    + APP_CSS_ASSET.etag
+    + """" />
+</head>
+<body>
+  <main class="wrap">
+    <section class="hero">
+      <h1>Web Analyzer</h1>
+      <p>Local quality audit for performance, security, SEO and accessibility.</p>
+    </section>
+
+    <section class="panel">
+      <form id="analyze-form">
+        <div class="row two">
+          <div>
+            <label for="api_key">API key (x-api-key)</label>
+            <input id="api_key" name="api_key" type="text" placeholder="Your API key" required />
+          </div>
+          <div>
+            <label for="url">Target URL</label>
+            <input id="url" name="url" type="text" placeholder="https://example.com" required />
+          </div>
+        </div>
+
+        <div class="row two">
+          <div>
+            <label for="mode">Mode</label>
+            <select id="mode" name="mode">
+              <option value="full">Full audit</option>
+              <option value="basic">Basic check</option>
+            </select>
+          </div>
+          <div>
+            <label for="timeout">Timeout (seconds)</label>
+            <input id="timeout" name="timeout" type="number" min="2" max="60" value="10" />
+          </div>
+        </div>
+
+        <div style="display:flex;justify-content:flex-end">
+          <button id="submit-btn" type="submit">Analyze</button>
+        </div>
+      </form>
+
+      <div id="status" class="status"></div>
+
+      <section id="result" class="result">
+        <div id="overall" class="overall"></div>
+        <div id="scores" class="score-grid"></div>
+        <label for="raw">JSON output</label>
+        <pre id="raw" class="raw"></pre>
+      </section>
+    </section>
+  </main>
+
+  <script src="/static/app.js?v="""
+    + APP_JS_ASSET.etag
+    + """"></script>
 </body>
 </html>
 """
+)
+
+
+INDEX_ASSET = _StaticAsset(INDEX_HTML, "text/html", "public, max-age=3600")
 
 
 class AnalyzeRequest(BaseModel):
@@ -434,28 +672,104 @@ class AnalyzeResponse(BaseModel):
     result: Dict[str, Any]
 
 
-app = FastAPI(title=APP_TITLE, version=APP_VERSION)
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Release the analysis pool and pooled HTTP connections on shutdown."""
+    global _EXECUTOR
+    yield
+    with _EXECUTOR_LOCK:
+        executor, _EXECUTOR = _EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+    close_http_session()
+
+
+app = FastAPI(title=APP_TITLE, version=APP_VERSION, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=False,
-    allow_methods=["GET", "POST", "OPTIONS"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "OPTIONS"),
+    # The only request headers the API reads; an explicit list lets the
+    # middleware answer preflights from headers it built at startup.
+    allow_headers=("content-type", "x-api-key"),
 )
 
 
+@lru_cache(maxsize=64)
+def _accepted_encodings(accept_encoding: str) -> FrozenSet[str]:
+    """Codings an Accept-Encoding header allows; ``q=0`` rules a coding out."""
+    accepted = set()
+    refused = set()
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        (accepted if quality > 0 else refused).add(coding)
+    if "*" in accepted:
+        accepted.update(coding for coding in ("br", "gzip") if coding not in refused)
+    return frozenset(accepted)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of ``etag`` against an If-None-Match list."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _asset_response(request: Request, asset: _StaticAsset) -> Response:
+    """Serve pre-built bytes (brotli or gzip when accepted), or 304 for a matching ETag."""
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+    if asset.body_br is not None and "br" in accepted:
+        body, headers = asset.body_br, asset.br_headers
+    elif "gzip" in accepted:
+        body, headers = asset.body_gzip, asset.gzip_headers
+    else:
+        body, headers = asset.body, asset.headers
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=asset.media_type, headers=headers)
+
+
 @app.get("/", response_class=HTMLResponse)
-def index() -> str:
-    return INDEX_HTML
+async def index(request: Request) -> Response:
+    return _asset_response(request, INDEX_ASSET)
+
+
+@app.get("/static/app.css", include_in_schema=False)
+async def app_css(request: Request) -> Response:
+    return _asset_response(request, APP_CSS_ASSET)
+
+
+@app.get("/static/app.js", include_in_schema=False)
+async def app_js(request: Request) -> Response:
+    return _asset_response(request, APP_JS_ASSET)
 
 
 @app.get("/api/health")
-def health() -> Dict[str, Any]:
+async def health() -> Dict[str, Any]:
     return {
         "status": "ok",
         "version": APP_VERSION,
-        "auth_configured": bool(_load_api_keys()),
+        "auth_configured": _api_keys_configured(),
         "rate_limit": {
             "requests": _int_env("WEB_ANALYZER_RATE_LIMIT_REQUESTS", 20, minimum=1),
             "window_seconds": _int_env("WEB_ANALYZER_RATE_LIMIT_WINDOW_SECONDS", 60, minimum=1),
@@ -463,22 +777,45 @@ def health() -> Dict[str, Any]:
     }
 
 
-@app.post("/api/analyze", response_model=AnalyzeResponse)
-def analyze(payload: AnalyzeRequest, request: Request) -> AnalyzeResponse:
-    started = time.time()
+_ANALYZE_PREFIX = b'{"ok":true,"elapsed_ms":'
+_ANALYZE_RESULT = b',"result":'
+
+
+def _dump_result(result: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(result)
+        except TypeError:  # e.g. non-str keys or ints beyond 64 bits
+            pass
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _fast_response(elapsed_ms: int, result: Dict[str, Any]) -> Response:
+    """Serialize an :class:`AnalyzeResponse` with its framing written by hand."""
+    body = b"".join(
+        (_ANALYZE_PREFIX, str(elapsed_ms).encode("ascii"), _ANALYZE_RESULT, _dump_result(result), b"}")
+    )
+    return Response(content=body, media_type="application/json")
+
+
+# The response is built from trusted analyzer output, so it bypasses pydantic;
+# the model is still published in the OpenAPI schema.
+@app.post("/api/analyze", response_model=None, responses={200: {"model": AnalyzeResponse}})
+async def analyze(payload: AnalyzeRequest, request: Request) -> Response:
+    started_ns = time.perf_counter_ns()
 
     api_key = _require_api_key(request)
     _apply_rate_limit(request, api_key)
 
+    # URL validation may resolve DNS and the analyzers block on HTTP, so both
+    # run off the event loop.
+    loop = asyncio.get_running_loop()
     try:
-        safe_url = validate_public_url(payload.url)
+        safe_url = await loop.run_in_executor(None, validate_public_url, payload.url)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    if payload.mode == "basic":
-        result = run_basic_analysis(safe_url, timeout=payload.timeout)
-    else:
-        result = run_full_audit(safe_url, timeout=payload.timeout)
+    result = await _run_analysis(safe_url, payload.mode, payload.timeout)
 
     if result.get("error"):
         error = result["error"]
@@ -486,7 +823,9 @@ def analyze(payload: AnalyzeRequest, request: Request) -> AnalyzeResponse:
             raise HTTPException(status_code=504, detail="Request timed out")
         if error == "connection_error":
             raise HTTPException(status_code=502, detail="Could not connect to target URL")
+        if error == "not_markup":
+            raise HTTPException(status_code=422, detail="Target URL is not an HTML page")
         raise HTTPException(status_code=500, detail=f"Analyzer error: {error}")
 
-    elapsed_ms = int((time.time() - started) * 1000)
-    return AnalyzeResponse(ok=True, elapsed_ms=elapsed_ms, result=result)
+    elapsed_ms = (time.perf_counter_ns() - started_ns) // 1_000_000
+    return _fast_response(elapsed_ms, result)
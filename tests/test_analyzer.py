@@ -1,10 +1,22 @@
+import asyncio
+import json
+import os
+import tempfile
 import unittest
 from contextlib import redirect_stdout
 from io import StringIO
 from unittest.mock import patch
 
+import httpx
+import requests
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import ConnectTimeoutError
+
 from src import analyzer
+from src.cache import AuditStore, TTLCache
+from src import fastargs
 from src.main import build_parser, main_batch, main_full
+from src.utils import modo_arquivo
 
 
 class FakeResponse:
@@ -12,10 +24,17 @@ class FakeResponse:
         self.url = url
         self.status_code = status_code
         self.text = text
-        self.headers = headers or {}
+        self.headers = CaseInsensitiveDict(headers or {})
         self.encoding = encoding
         self.content = text.encode(encoding)
 
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
 
 SAMPLE_HTML = """
 <!doctype html>
@@ -55,7 +74,7 @@ class AnalyzerTests(unittest.TestCase):
         score = analyzer.calculate_overall_score(criteria_scores)
         self.assertAlmostEqual(score, 75.0)
 
-    @patch("src.analyzer.requests.get")
+    @patch("src.analyzer._SESSION.get")
     def test_run_full_audit_local_only(self, mock_get):
         mock_get.return_value = FakeResponse(
             text=SAMPLE_HTML,
@@ -86,7 +105,295 @@ class AnalyzerTests(unittest.TestCase):
             self.assertGreaterEqual(criteria[key]["score"], 0)
             self.assertLessEqual(criteria[key]["score"], 100)
 
-    @patch("src.analyzer.requests.get", side_effect=Exception("boom"))
+    def test_collect_dom_stats(self):
+        html = (
+            "<html lang='pt'><body>"
+            "<h1>a</h1><h3>b</h3>"
+            "<img src='http://cdn.example.com/a.png' alt='a' /><img src='/b.png' />"
+            "<a href='/x' target='_blank'>x</a><a href='/y' target='_blank' rel='noopener'>y</a>"
+            "<label for='q'>Q</label><input id='q' /><input type='hidden' />"
+            "<button></button><center>old</center>"
+            "</body></html>"
+        )
+        stats = analyzer._extract_basic_html_stats(html)
+
+        self.assertEqual(stats.lang, "pt")
+        self.assertFalse(stats.doctype_ok)
+        self.assertTrue(analyzer._extract_basic_html_stats(SAMPLE_HTML).doctype_ok)
+        self.assertEqual(stats.heading_levels, [1, 3])
+        self.assertEqual(stats.images, 2)
+        self.assertEqual(stats.images_with_alt, 1)
+        self.assertEqual(stats.links, 2)
+        self.assertEqual(stats.request_count, 2)
+        self.assertEqual(stats.insecure_subresources, 1)
+        self.assertEqual(stats.insecure_blank_links, 1)
+        self.assertEqual(stats.deprecated_tags, 1)
+        self.assertEqual(analyzer._form_label_coverage(stats), 1.0)
+        self.assertEqual(analyzer._button_accessibility_coverage(stats), 0.0)
+
+    @unittest.skipIf(analyzer.LexborHTMLParser is None, "selectolax not installed")
+    def test_fast_parser_matches_soup_stats(self):
+        html = (
+            "<html lang='pt'><body><h2>a</h2>"
+            "<label>Name <input /></label><input type='submit' value='Go' />"
+            "<button><span>icon</span> Save</button><img src='/a.png' />"
+            "</body></html>"
+        )
+        for document in (SAMPLE_HTML, html):
+            with self.subTest(document=document[:20]):
+                self.assertEqual(
+                    analyzer._extract_basic_html_stats(document, fast=True),
+                    analyzer._extract_basic_html_stats(document),
+                )
+
+    def test_fast_basic_stats_matches_dom_walk(self):
+        html = (
+            "<TITLE>A &amp; B</TITLE>"
+            "<meta http-equiv='content-type' content='text/html; charset=latin1'>"
+            "<META NAME=viewport content='a>b'><meta charset='utf-8'>"
+            "<A href='/x'>x</A><abbr>y</abbr><IMG src='/a.png'>"
+        )
+        fields = ("title", "images", "links", "has_viewport", "meta_charset")
+        for document in (SAMPLE_HTML, html):
+            fast = analyzer._fast_basic_stats(document)
+            full = analyzer._extract_basic_html_stats(document)
+            with self.subTest(document=document[:20]):
+                self.assertEqual(
+                    [getattr(fast, name) for name in fields],
+                    [getattr(full, name) for name in fields],
+                )
+
+    @patch("src.analyzer._SESSION.get")
+    def test_basic_counts_do_not_depend_on_cache_state(self, mock_get):
+        html = SAMPLE_HTML + (
+            "<!-- <img src='/old.png'> <a href='/old'>old</a> -->"
+            "<script>document.write('<img src=/x.png><a href=/y>y</a>')</script>"
+            "<STYLE>a::after { content: '<a>'; }</STYLE>"
+        )
+        mock_get.return_value = FakeResponse(text=html)
+        analyzer._RESULT_CACHE.clear()
+        analyzer._FETCH_CACHE.clear()
+        analyzer._STATS_CACHE.clear()
+
+        cold = analyzer.analyze_url("https://example.com/counts")
+        analyzer.analyze_url("https://example.com/counts", full=True)
+        analyzer._RESULT_CACHE.clear()
+        warm = analyzer.analyze_url("https://example.com/counts")
+
+        self.assertEqual((cold["images"], cold["links"]), (1, 1))
+        self.assertEqual((warm["images"], warm["links"]), (1, 1))
+
+    def test_run_batch_async_keeps_input_order(self):
+        async def fake_fetch(_client, url, timeout=10, store=None):
+            if "down" in url:
+                raise httpx.ConnectError("refused")
+            return {
+                "html": SAMPLE_HTML,
+                "encoding": "utf-8",
+                "elapsed": 0.1,
+                "final_url": url,
+                "status": 200,
+                "headers": {},
+                "content_size_bytes": len(SAMPLE_HTML),
+                "truncated": False,
+                "skipped": None,
+            }
+
+        with patch("src.analyzer._fetch_url_async", side_effect=fake_fetch):
+            results = asyncio.run(
+                analyzer.run_batch_async(["example.com", "down.example.com"], full=True, concurrency=2)
+            )
+
+        self.assertEqual([item["url"] for item in results], ["https://example.com", "https://down.example.com"])
+        self.assertIsNone(results[0]["error"])
+        self.assertIn("overall_score", results[0])
+        self.assertEqual(results[1]["error"], "connection_error")
+
+    @patch("src.analyzer._get_process_pool")
+    def test_run_batch_async_basic_matches_sync_scan(self, mock_pool):
+        html = SAMPLE_HTML + "<!-- <img src='/old.png'> <a href='/old'>old</a> -->"
+        fetched = {
+            "html": html,
+            "encoding": "utf-8",
+            "elapsed": 0.1,
+            "final_url": "https://example.com",
+            "status": 200,
+            "headers": {},
+            "content_size_bytes": len(html),
+            "truncated": False,
+            "skipped": None,
+        }
+
+        async def fake_fetch(_client, url, timeout=10, store=None):
+            return fetched
+
+        with patch("src.analyzer._fetch_url_async", side_effect=fake_fetch):
+            (result,) = asyncio.run(analyzer.run_batch_async(["example.com"], concurrency=1))
+
+        expected = analyzer._score_html("https://example.com", result["timestamp"], fetched, full=False)
+        self.assertEqual(result, expected)
+        mock_pool.return_value.submit.assert_not_called()
+
+    def test_connect_timeout_is_not_retried(self):
+        def time_out(conn):
+            raise ConnectTimeoutError(conn, "timed out")
+
+        with patch("urllib3.connection.HTTPConnection._new_conn", autospec=True, side_effect=time_out) as mock_conn:
+            with self.assertRaises(requests.exceptions.ConnectTimeout):
+                analyzer._SESSION.get("http://unreachable.example/", timeout=1)
+
+        # One attempt, so the failure arrives within a single timeout budget.
+        self.assertEqual(mock_conn.call_count, 1)
+
+    @patch("src.analyzer._SESSION.get")
+    def test_fetch_url_caps_body_size(self, mock_get):
+        mock_get.return_value = FakeResponse(text="<p>" + "x" * 5000 + "</p>")
+
+        fetched = analyzer._fetch_url("https://example.com", max_bytes=1024)
+
+        self.assertTrue(fetched["truncated"])
+        self.assertIsNone(fetched["skipped"])
+        self.assertEqual(fetched["content_size_bytes"], 1024)
+        self.assertEqual(len(fetched["html"]), 1024)
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+
+    @patch("src.analyzer._SESSION.get")
+    def test_fetch_url_skips_non_html_bodies(self, mock_get):
+        mock_get.return_value = FakeResponse(text="%PDF-1.7", headers={"Content-Type": "application/pdf"})
+
+        fetched = analyzer._fetch_url("https://example.com/file.pdf")
+
+        self.assertFalse(fetched["truncated"])
+        self.assertEqual(fetched["skipped"], "not_markup")
+        self.assertEqual(fetched["content_size_bytes"], 0)
+        self.assertEqual(fetched["html"], "")
+        for content_type in ("text/html; charset=utf-8", "application/xhtml+xml", "text/plain", ""):
+            with self.subTest(content_type=content_type):
+                self.assertTrue(analyzer._is_markup(content_type))
+        for content_type in ("image/svg+xml", "application/rss+xml", "application/pdf"):
+            with self.subTest(content_type=content_type):
+                self.assertFalse(analyzer._is_markup(content_type))
+
+    @patch("src.analyzer._SESSION.get")
+    def test_non_html_pages_are_not_scored_or_cached(self, mock_get):
+        mock_get.return_value = FakeResponse(text="%PDF-1.7", headers={"Content-Type": "application/pdf"})
+        analyzer._RESULT_CACHE.clear()
+        analyzer._FETCH_CACHE.clear()
+
+        full = analyzer.run_full_audit("https://example.com/file.pdf")
+        basic = analyzer.analyze_url("https://example.com/file.pdf")
+        again = analyzer.analyze_url("https://example.com/file.pdf")
+
+        self.assertEqual(full["error"], "not_markup")
+        self.assertNotIn("overall_score", full)
+        self.assertEqual(basic["error"], "not_markup")
+        self.assertNotIn("images", basic)
+        self.assertIsNot(basic, again)
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(len(analyzer._FETCH_CACHE), 0)
+
+    def test_run_batch_async_does_not_score_non_html_pages(self):
+        async def fake_fetch(_client, url, timeout=10, store=None):
+            return {
+                "html": "",
+                "encoding": None,
+                "elapsed": 0.1,
+                "final_url": url,
+                "status": 200,
+                "headers": {"content-type": "image/png"},
+                "content_size_bytes": 0,
+                "truncated": False,
+                "skipped": "not_markup",
+            }
+
+        with patch("src.analyzer._fetch_url_async", side_effect=fake_fetch):
+            results = asyncio.run(analyzer.run_batch_async(["example.com/a.png"], full=True, concurrency=1))
+
+        self.assertEqual([item["error"] for item in results], ["not_markup"])
+
+    @patch("src.analyzer._SESSION.get")
+    def test_fetch_url_does_not_store_non_html_bodies(self, mock_get):
+        mock_get.return_value = FakeResponse(
+            text="%PDF-1.7", headers={"Content-Type": "application/pdf", "ETag": '"v1"'}
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = AuditStore(os.path.join(tmp_dir, "cache.sqlite"))
+            try:
+                analyzer._fetch_url("https://example.com/file.pdf", store=store)
+                self.assertIsNone(store.get_page("https://example.com/file.pdf"))
+            finally:
+                store.close()
+
+    @patch("src.analyzer._SESSION.get")
+    def test_fetch_url_revalidates_stored_page(self, mock_get):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = AuditStore(os.path.join(tmp_dir, "cache.sqlite"))
+            try:
+                mock_get.return_value = FakeResponse(text=SAMPLE_HTML, headers={"ETag": '"v1"'})
+                first = analyzer._fetch_url("https://example.com", store=store)
+
+                mock_get.return_value = FakeResponse(status_code=304, headers={"ETag": '"v1"'})
+                second = analyzer._fetch_url("https://example.com", store=store)
+            finally:
+                store.close()
+
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(second["status"], 200)
+        self.assertEqual(second["html"], first["html"])
+        self.assertEqual(second["content_size_bytes"], first["content_size_bytes"])
+
+    @patch("src.analyzer._SESSION.get")
+    def test_verificar_url_reuses_cached_result(self, mock_get):
+        mock_get.return_value = FakeResponse(text=SAMPLE_HTML)
+        analyzer._RESULT_CACHE.clear()
+        analyzer._FETCH_CACHE.clear()
+
+        with redirect_stdout(StringIO()):
+            first = analyzer.verificar_url("https://example.com/cached", full=True)
+            second = analyzer.verificar_url("example.com/cached", full=True)
+            basic = analyzer.verificar_url("https://example.com/cached")
+            analyzer.verificar_url("https://example.com/cached", full=True, use_cache=False)
+
+        self.assertIs(first, second)
+        self.assertEqual(basic["mode"], "basic")
+        self.assertEqual(basic["title"], "Example Quality Test Page")
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("src.analyzer._SESSION.get")
+    def test_analyze_url_does_not_reuse_error_status(self, mock_get):
+        mock_get.return_value = FakeResponse(status_code=503, text="<title>Down</title>")
+        analyzer._RESULT_CACHE.clear()
+        analyzer._FETCH_CACHE.clear()
+
+        first = analyzer.analyze_url("https://example.com/unavailable")
+        second = analyzer.analyze_url("https://example.com/unavailable")
+
+        self.assertEqual(first["status"], 503)
+        self.assertIsNot(first, second)
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_ttl_cache_caps_total_weight(self):
+        cache = TTLCache(maxsize=10, ttl=60, maxweight=10, weigh=len)
+        cache.set("a", "x" * 4)
+        cache.set("b", "x" * 4)
+        cache.set("c", "x" * 4)
+        cache.set("huge", "x" * 11)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual([cache.get("b"), cache.get("c")], ["x" * 4, "x" * 4])
+        self.assertIsNone(cache.get("huge"))
+
+    def test_emit_report_writes_to_given_stream(self):
+        result = {"mode": "basic", "url": "https://example.com", "error": "timeout"}
+        buffer = StringIO()
+        with redirect_stdout(StringIO()) as stdout:
+            analyzer.emit_report(result, output_format="json", output=buffer)
+
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertEqual(json.loads(buffer.getvalue())["url"], "https://example.com")
+        self.assertTrue(buffer.getvalue().endswith("\n"))
+
+    @patch("src.analyzer._SESSION.get", side_effect=Exception("boom"))
     def test_run_basic_analysis_handles_unexpected_error(self, _mock_get):
         result = analyzer.run_basic_analysis("https://example.com")
         self.assertEqual(result["mode"], "basic")
@@ -115,6 +422,51 @@ class CliParserTests(unittest.TestCase):
         self.assertEqual(args.arquivo, "urls.txt")
         self.assertTrue(args.full)
 
+    def test_parser_accepts_async_batch_flags(self):
+        parser = build_parser()
+        args = parser.parse_args(["--arquivo", "urls.txt", "--async", "--concurrency", "50", "-w", "4"])
+        self.assertTrue(args.use_async)
+        self.assertEqual(args.concurrency, 50)
+        self.assertEqual(args.workers, 4)
+
+    def test_fastargs_matches_argparse(self):
+        cases = [
+            [],
+            ["https://example.com"],
+            ["https://example.com", "-F", "-o", "json", "-t", "15", "-r", "out.json"],
+            ["--arquivo", "urls.txt", "--full", "-j", "--async", "--concurrency", "5", "-w", "3"],
+            ["-f", "urls.txt", "--no-cache", "--cache-ttl", "60", "-h"],
+            ["https://example.com", "--cache"],
+        ]
+        for argv in cases:
+            with self.subTest(argv=argv):
+                self.assertEqual(vars(fastargs.parse(argv)), vars(build_parser().parse_args(argv)))
+
+    def test_parsers_share_one_defaults_table(self):
+        changed = {"timeout": 7, "format": "json", "workers": 3, "concurrency": 9, "cache_ttl": 11}
+        with patch.dict(fastargs.DEFAULTS, changed):
+            for args in (fastargs.parse([]), build_parser().parse_args([])):
+                with self.subTest(parser=type(args).__name__):
+                    self.assertEqual({name: getattr(args, name) for name in changed}, changed)
+
+    def test_fastargs_defers_unusual_input(self):
+        for argv in (["--timeout=5"], ["-Fj"], ["-o", "xml"], ["-t", "soon"], ["a", "b"], ["--time", "5"]):
+            with self.subTest(argv=argv):
+                self.assertIsNone(fastargs.parse(argv))
+
+    @patch("src.analyzer.verificar_url")
+    @patch("src.main.open_audit_store")
+    def test_persistent_store_is_opt_in(self, mock_open_store, mock_verificar):
+        from src.main import main
+
+        self.assertEqual(main(["https://example.com"]), 0)
+        mock_open_store.assert_not_called()
+        self.assertIsNone(mock_verificar.call_args.kwargs["store"])
+
+        self.assertEqual(main(["https://example.com", "--cache"]), 0)
+        mock_open_store.assert_called_once()
+        self.assertIs(mock_verificar.call_args.kwargs["store"], mock_open_store.return_value)
+
     @patch("src.main.main")
     def test_main_full_wrapper(self, mock_main):
         mock_main.return_value = 0
@@ -131,6 +483,21 @@ class CliParserTests(unittest.TestCase):
             ["--arquivo", "urls.txt", "--full", "-j", "-r", "./reports"]
         )
 
+    @patch("src.analyzer.analyze_url")
+    def test_modo_arquivo_checks_every_url(self, mock_analyze):
+        mock_analyze.side_effect = lambda url, **_kwargs: {"mode": "basic", "url": url, "error": "timeout"}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            urls_file = os.path.join(tmp_dir, "urls.txt")
+            with open(urls_file, "w", encoding="utf-8") as handle:
+                handle.write("a.example\n\nb.example\nc.example\n")
+            output = StringIO()
+            with redirect_stdout(output):
+                modo_arquivo(urls_file, workers=2, use_cache=False)
+
+        self.assertEqual(sorted(call.args[0] for call in mock_analyze.call_args_list), ["a.example", "b.example", "c.example"])
+        self.assertEqual(output.getvalue().count("Error: timeout"), 3)
+
     def test_main_batch_wrapper_requires_file(self):
         with redirect_stdout(StringIO()):
             rc = main_batch([])
@@ -1,14 +1,19 @@
+import json
 import os
 import unittest
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 
+from src import url_safety, webapp
 from src.url_safety import validate_public_url
 from src.webapp import app, reset_runtime_state
 
 
 class UrlSafetyTests(unittest.TestCase):
+    def setUp(self):
+        url_safety.clear_caches()
+
     @patch("src.url_safety._resolve_host_ips")
     def test_validate_public_url_accepts_public_host(self, mock_resolve):
         import ipaddress
@@ -17,6 +22,61 @@ class UrlSafetyTests(unittest.TestCase):
         safe = validate_public_url("example.com")
         self.assertEqual(safe, "https://example.com")
 
+    @patch("src.url_safety.socket.getaddrinfo")
+    def test_resolve_host_ips_caches_lookups(self, mock_getaddrinfo):
+        mock_getaddrinfo.return_value = [(2, 1, 6, "", ("93.184.216.34", 0))]
+
+        first = url_safety._resolve_host_ips("cached.example.com")
+        second = url_safety._resolve_host_ips("cached.example.com")
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_getaddrinfo.call_count, 1)
+
+    @patch("src.url_safety.socket.getaddrinfo")
+    def test_resolve_host_ips_shares_lookup_in_flight(self, mock_getaddrinfo):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        release = threading.Event()
+
+        def slow_lookup(*_args):
+            release.wait(5)
+            return [(2, 1, 6, "", ("93.184.216.34", 0))]
+
+        mock_getaddrinfo.side_effect = slow_lookup
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(url_safety._resolve_host_ips, "shared.example.com") for _ in range(4)]
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertTrue(all(result == results[0] and result for result in results))
+        self.assertEqual(mock_getaddrinfo.call_count, 1)
+
+    @patch("src.url_safety._resolve_host_ips")
+    def test_validate_public_url_memoizes_accepted_urls(self, mock_resolve):
+        import ipaddress
+
+        mock_resolve.return_value = [ipaddress.ip_address("93.184.216.34")]
+        validate_public_url("memo.example.com")
+        validate_public_url("memo.example.com")
+        self.assertEqual(mock_resolve.call_count, 1)
+
+    @patch("src.url_safety._resolve_host_ips")
+    def test_validate_public_url_remembers_rejections(self, mock_resolve):
+        import ipaddress
+
+        mock_resolve.return_value = [ipaddress.ip_address("10.0.0.5")]
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                validate_public_url("internal.example.com")
+        self.assertEqual(mock_resolve.call_count, 1)
+
+        mock_resolve.return_value = []
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                validate_public_url("missing.example.com")
+        self.assertEqual(mock_resolve.call_count, 3)
+
     def test_validate_public_url_blocks_localhost(self):
         with self.assertRaises(ValueError):
             validate_public_url("http://localhost:8000")
@@ -25,11 +85,70 @@ class UrlSafetyTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             validate_public_url("http://192.168.0.10")
 
+    def test_simple_url_fast_path_agrees_with_urlparse(self):
+        from src.analyzer import parse_normalized_url
+
+        fast = ["example.com", "https://Example.COM/path", "http://host:8080?x", "https://a.b.c:123/x@y"]
+        slow = ["http://a:b@c.com", "http://a:80@c.com", "example.com\\@evil.com", "https://[::1]/"]
+        for url in fast + slow:
+            with self.subTest(url=url):
+                match = url_safety._SIMPLE_URL_RE.match(url_safety.normalize_url(url))
+                if url in slow:
+                    self.assertIsNone(match)
+                    continue
+                parsed = parse_normalized_url(url)[1]
+                self.assertIsNone(parsed.username)
+                self.assertEqual(match.group(1).lower(), parsed.hostname)
+
+    def test_ipv4_blocklist_matches_ipaddress(self):
+        import ipaddress
+
+        def blocked(ip):
+            return (
+                ip.is_private
+                or ip.is_loopback
+                or ip.is_link_local
+                or ip.is_multicast
+                or ip.is_reserved
+                or ip.is_unspecified
+            )
+
+        edges = ["8.8.8.8", "100.64.0.1", "255.255.255.255", "223.255.255.255"]
+        for low, high in url_safety._BLOCKED_IPV4_RANGES:
+            for value in (low - 1, low, high, high + 1):
+                if 0 <= value < 2**32:
+                    edges.append(str(ipaddress.IPv4Address(value)))
+        for address in edges:
+            ip = ipaddress.ip_address(address)
+            if ip in ipaddress.ip_network("192.0.0.0/24"):
+                continue
+            with self.subTest(address=address):
+                value = url_safety._ipv4_int(address)
+                self.assertEqual(value, int(ip))
+                self.assertEqual(url_safety._is_blocked_ipv4_int(value), blocked(ip))
+
+        self.assertIsNone(url_safety._ipv4_int("010.0.0.1"))
+
+    @patch("src.url_safety._resolve_host_ips")
+    def test_non_ascii_digit_hosts_are_not_ip_literals(self, mock_resolve):
+        import ipaddress
+
+        mock_resolve.return_value = [ipaddress.ip_address("10.0.0.5")]
+        for host in ("\u0668.\u0668.\u0668.\u0668", "1.2.3.\u00b2"):
+            with self.subTest(host=host):
+                self.assertIsNone(url_safety._ipv4_int(host))
+                with self.assertRaisesRegex(ValueError, "resolves to private"):
+                    validate_public_url("http://" + host)
+        self.assertEqual(mock_resolve.call_count, 2)
+
 
 class WebApiTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app)
+
     def setUp(self):
         reset_runtime_state()
-        self.client = TestClient(app)
 
     def _headers(self, api_key: str = "test-key"):
         return {"x-api-key": api_key}
@@ -43,6 +162,82 @@ class WebApiTests(unittest.TestCase):
         self.assertIn("auth_configured", payload)
         self.assertIn("rate_limit", payload)
 
+    def test_index_serves_cached_page(self):
+        plain = self.client.get("/", headers={"Accept-Encoding": "identity"})
+        compressed = self.client.get("/", headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(plain.status_code, 200)
+        self.assertNotIn("content-encoding", plain.headers)
+        self.assertEqual(compressed.headers["content-encoding"], "gzip")
+        self.assertEqual(compressed.text, plain.text)
+        self.assertIn("Web Analyzer", plain.text)
+        self.assertIn("max-age", plain.headers["cache-control"])
+
+        revalidated = self.client.get(
+            "/", headers={"Accept-Encoding": "identity", "If-None-Match": plain.headers["etag"]}
+        )
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.content, b"")
+
+    def test_index_prefers_brotli_when_available(self):
+        response = self.client.get("/", headers={"Accept-Encoding": "br, gzip"})
+
+        expected = "br" if webapp.brotli is not None else "gzip"
+        self.assertEqual(response.headers["content-encoding"], expected)
+        self.assertTrue(response.headers["etag"].endswith(f'-{expected}"'))
+
+    def test_index_honours_refused_encodings(self):
+        no_brotli = self.client.get("/", headers={"Accept-Encoding": "br;q=0, gzip"})
+        self.assertEqual(no_brotli.headers["content-encoding"], "gzip")
+
+        no_gzip = self.client.get("/", headers={"Accept-Encoding": "gzip;q=0"})
+        self.assertNotIn("content-encoding", no_gzip.headers)
+
+        wildcard = self.client.get("/", headers={"Accept-Encoding": "*, br;q=0"})
+        self.assertEqual(wildcard.headers["content-encoding"], "gzip")
+
+    def test_index_revalidates_etag_lists(self):
+        plain = self.client.get("/", headers={"Accept-Encoding": "identity"})
+        etag = plain.headers["etag"]
+
+        for if_none_match in (f'"stale", W/{etag}', f'"stale",{etag}', "*"):
+            with self.subTest(if_none_match=if_none_match):
+                response = self.client.get(
+                    "/", headers={"Accept-Encoding": "identity", "If-None-Match": if_none_match}
+                )
+                self.assertEqual(response.status_code, 304)
+
+        stale = self.client.get("/", headers={"Accept-Encoding": "identity", "If-None-Match": '"stale"'})
+        self.assertEqual(stale.status_code, 200)
+
+    def test_static_assets_are_versioned_and_revalidated(self):
+        page = self.client.get("/").text
+        self.assertIn(f"/static/app.js?v={webapp.APP_JS_ASSET.etag}", page)
+        self.assertIn(f"/static/app.css?v={webapp.APP_CSS_ASSET.etag}", page)
+
+        script = self.client.get("/static/app.js")
+        self.assertEqual(script.status_code, 200)
+        self.assertIn("analyze-form", script.text)
+        self.assertIn("immutable", script.headers["cache-control"])
+
+        cached = self.client.get("/static/app.js", headers={"If-None-Match": script.headers["etag"]})
+        self.assertEqual(cached.status_code, 304)
+
+    def test_cors_preflight_allows_api_headers(self):
+        response = self.client.options(
+            "/api/analyze",
+            headers={
+                "Origin": "https://example.org",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "content-type, x-api-key",
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        allowed = response.headers["access-control-allow-headers"].lower()
+        self.assertIn("x-api-key", allowed)
+        self.assertIn("content-type", allowed)
+
     def test_analyze_requires_api_key(self):
         with patch.dict(os.environ, {"WEB_ANALYZER_API_KEY": "test-key"}, clear=False):
             response = self.client.post(
@@ -72,6 +267,52 @@ class WebApiTests(unittest.TestCase):
         self.assertEqual(response.status_code, 401)
         self.assertIn("Invalid API key", response.json()["detail"])
 
+    def test_api_keys_are_read_once_until_reset(self):
+        with patch.dict(os.environ, {"WEB_ANALYZER_API_KEYS": "first, second"}, clear=False):
+            self.assertEqual(webapp._load_api_keys(), {"first", "second"})
+        with patch.dict(os.environ, {"WEB_ANALYZER_API_KEYS": "third"}, clear=False):
+            self.assertEqual(webapp._load_api_keys(), {"first", "second"})
+            reset_runtime_state()
+            self.assertIn("third", webapp._load_api_keys())
+
+    def test_api_key_matches_in_constant_time(self):
+        keys = frozenset({"first", "second"})
+        self.assertTrue(webapp._api_key_matches("second", keys))
+        self.assertFalse(webapp._api_key_matches("secon", keys))
+        self.assertFalse(webapp._api_key_matches("chav\u00e9", keys))
+
+    def test_rate_limit_settings_are_read_once_until_reset(self):
+        name = "WEB_ANALYZER_RATE_LIMIT_REQUESTS"
+        with patch.dict(os.environ, {name: "5"}, clear=False):
+            self.assertEqual(webapp._int_env(name, 20, minimum=1), 5)
+        with patch.dict(os.environ, {name: "7"}, clear=False):
+            self.assertEqual(webapp._int_env(name, 20, minimum=1), 5)
+            reset_runtime_state()
+            self.assertEqual(webapp._int_env(name, 20, minimum=1), 7)
+
+    def test_rate_limiter_refills_tokens_over_the_window(self):
+        limiter = webapp.TokenBucketRateLimiter()
+
+        def allow(identity, now):
+            return limiter.allow(identity, max_requests=2, window_seconds=60, now=now)
+
+        self.assertEqual(allow("id", 1000.0), (True, 0))
+        self.assertEqual(allow("id", 1000.0), (True, 0))
+        self.assertEqual(allow("id", 1000.0), (False, 30))
+        self.assertEqual(allow("other", 1000.0), (True, 0))
+
+        self.assertEqual(allow("id", 1030.0), (True, 0))
+        self.assertFalse(allow("id", 1030.0)[0])
+
+    def test_rate_limiter_forgets_least_recent_identities(self):
+        limiter = webapp.TokenBucketRateLimiter(shards=1, max_identities=2)
+        for identity in ("a", "b", "a", "c"):
+            limiter.allow(identity, max_requests=1, window_seconds=60)
+
+        # "b" was evicted by "c", so its spent token is forgotten; "a" was not.
+        self.assertFalse(limiter.allow("a", max_requests=1, window_seconds=60)[0])
+        self.assertTrue(limiter.allow("b", max_requests=1, window_seconds=60)[0])
+
     @patch("src.webapp.validate_public_url")
     @patch("src.webapp.run_full_audit")
     def test_analyze_full_sync(self, mock_full, mock_validate):
@@ -115,6 +356,104 @@ class WebApiTests(unittest.TestCase):
         mock_validate.assert_called_once()
         mock_full.assert_called_once_with("https://example.com", timeout=10)
 
+    def test_fast_response_matches_response_model(self):
+        result = {"mode": "basic", "status": 200, "title": "Caf\u00e9", "headers": {"server": "x"}}
+        response = webapp._fast_response(42, result)
+        self.assertEqual(response.media_type, "application/json")
+        self.assertEqual(
+            json.loads(response.body),
+            webapp.AnalyzeResponse(ok=True, elapsed_ms=42, result=result).model_dump(),
+        )
+
+        # Payloads orjson rejects fall back to the standard library encoder.
+        fallback = webapp._fast_response(1, {"big": 2**70, 7: "seven"})
+        self.assertEqual(json.loads(fallback.body)["result"], {"big": 2**70, "7": "seven"})
+
+    @patch("src.webapp.validate_public_url")
+    @patch("src.webapp.run_basic_analysis")
+    def test_analyze_reuses_recent_results(self, mock_basic, mock_validate):
+        mock_validate.return_value = "https://example.com"
+        mock_basic.return_value = {"mode": "basic", "error": None, "status": 200, "title": "OK"}
+        body = {"url": "https://example.com", "mode": "basic", "timeout": 10}
+
+        with patch.dict(os.environ, {"WEB_ANALYZER_API_KEY": "test-key"}, clear=False):
+            first = self.client.post("/api/analyze", headers=self._headers(), json=body)
+            second = self.client.post("/api/analyze", headers=self._headers(), json=body)
+            reset_runtime_state()
+            with patch.dict(os.environ, {"WEB_ANALYZER_RESULT_CACHE_SECONDS": "0"}, clear=False):
+                self.client.post("/api/analyze", headers=self._headers(), json=body)
+                self.client.post("/api/analyze", headers=self._headers(), json=body)
+
+        self.assertEqual(first.json()["result"], second.json()["result"])
+        self.assertEqual(mock_basic.call_count, 3)
+
+    @patch("src.webapp.run_full_audit")
+    def test_concurrent_identical_analyses_share_one_run(self, mock_full):
+        import asyncio
+        import threading
+
+        release = threading.Event()
+
+        def slow_audit(url, timeout):
+            release.wait(5)
+            return {"mode": "full", "error": None, "url": url}
+
+        mock_full.side_effect = slow_audit
+
+        async def run_both():
+            tasks = [asyncio.ensure_future(webapp._run_analysis("https://example.com", "full", 10)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(*tasks)
+
+        first, second = asyncio.run(run_both())
+        self.assertIs(first, second)
+        self.assertEqual(mock_full.call_count, 1)
+
+    @patch("src.webapp.run_full_audit")
+    def test_cancelled_first_caller_keeps_analysis_shared(self, mock_full):
+        import asyncio
+        import threading
+
+        release = threading.Event()
+
+        def slow_audit(url, timeout):
+            release.wait(5)
+            return {"mode": "full", "error": None, "url": url}
+
+        mock_full.side_effect = slow_audit
+
+        async def cancel_first():
+            first = asyncio.ensure_future(webapp._run_analysis("https://example.com", "full", 10))
+            await asyncio.sleep(0.05)
+            shared = webapp._INFLIGHT[("https://example.com", "full", 10)]
+            first.cancel()
+            await asyncio.sleep(0)
+            self.assertIs(webapp._INFLIGHT.get(("https://example.com", "full", 10)), shared)
+
+            second = asyncio.ensure_future(webapp._run_analysis("https://example.com", "full", 10))
+            await asyncio.sleep(0.05)
+            release.set()
+            return await second, await shared
+
+        joined, shared_result = asyncio.run(cancel_first())
+        self.assertIs(joined, shared_result)
+        self.assertEqual(mock_full.call_count, 1)
+        self.assertNotIn(("https://example.com", "full", 10), webapp._INFLIGHT)
+
+    @patch("src.webapp.validate_public_url")
+    @patch("src.webapp.run_full_audit")
+    def test_analyze_reports_non_html_targets(self, mock_full, mock_validate):
+        mock_validate.return_value = "https://example.com/file.pdf"
+        mock_full.return_value = {"mode": "full", "error": "not_markup"}
+        body = {"url": "https://example.com/file.pdf", "mode": "full", "timeout": 10}
+
+        with patch.dict(os.environ, {"WEB_ANALYZER_API_KEY": "test-key"}, clear=False):
+            response = self.client.post("/api/analyze", headers=self._headers(), json=body)
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["detail"], "Target URL is not an HTML page")
+
     @patch("src.webapp.validate_public_url", side_effect=ValueError("blocked"))
     def test_analyze_rejects_bad_url(self, _mock_validate):
         with patch.dict(os.environ, {"WEB_ANALYZER_API_KEY": "test-key"}, clear=False):